@@ -1,7 +1,28 @@
 """Audio capture and processing modules."""
 
-from .capture import AudioCapture
-from .vad import VoiceActivityDetector
-from .buffer import StreamingAudioBuffer, SimpleAudioBuffer
+import importlib
 
-__all__ = ["AudioCapture", "VoiceActivityDetector", "StreamingAudioBuffer", "SimpleAudioBuffer"]
+# Imported on first access (PEP 562): capture pulls in pyaudiowpatch and
+# the VAD pulls in torch, neither of which is needed to use the buffers.
+_LAZY_IMPORTS = {
+    "AudioCapture": ".capture",
+    "VoiceActivityDetector": ".vad",
+    "StreamingAudioBuffer": ".buffer",
+    "SimpleAudioBuffer": ".buffer",
+    "SegmentRing": ".buffer",
+}
+
+__all__ = ["AudioCapture", "VoiceActivityDetector", "StreamingAudioBuffer", "SimpleAudioBuffer", "SegmentRing"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,7 +9,6 @@ import threading
 import time
 from typing import Callable, Optional, List
 from dataclasses import dataclass
-from collections import deque
 import numpy as np
 
 
@@ -21,6 +20,103 @@ class AudioSegment:
     is_speech: bool
     
 
+class SegmentRing:
+    """
+    Fixed-capacity ring of preallocated float32 audio segments.
+    
+    Hands completed segments from the buffer to the transcription worker
+    without per-segment allocation. Slots are copied in and out under a
+    short lock: the buffers deliver segments from short-lived threads, and
+    a full ring evicts its oldest segment (newest wins), which moves the
+    read index from the producer side. With several producers and eviction
+    racing the consumer, the ring is not lock-free and the lock is required.
+    Nothing on the audio callback thread ever touches the lock.
+    
+    Example:
+        >>> ring = SegmentRing(capacity=4, max_samples=16000 * 6)
+        >>> ring.try_push(segment)  # Producer
+        >>> audio = ring.try_pop()  # Consumer (None when empty)
+    """
+    
+    def __init__(self, capacity: int, max_samples: int, drop_oldest: bool = True):
+        """
+        Initialize the ring.
+        
+        Args:
+            capacity: Number of segment slots
+            max_samples: Slot size; longer segments keep their newest samples
+            drop_oldest: When full, evict the oldest segment (stale audio is
+                        useless for live captions) instead of the new one
+        """
+        self._capacity = capacity
+        self._slots = np.empty((capacity, max_samples), dtype=np.float32)
+        self._lengths = [0] * capacity
+        self._head = 0  # Next slot to write
+        self._tail = 0  # Next slot to read
+        self._drop_oldest = drop_oldest
+        self._lock = threading.Lock()
+        self._ready = threading.Event()  # Wake-up only, never required for correctness
+        self.dropped = 0
+    
+    def __len__(self) -> int:
+        return self._head - self._tail
+    
+    def try_push(self, audio: np.ndarray) -> bool:
+        """
+        Copy a segment into the next free slot.
+        
+        Returns:
+            False if the ring was full and a segment was dropped
+        """
+        max_samples = self._slots.shape[1]
+        if len(audio) > max_samples:
+            audio = audio[-max_samples:]
+        
+        accepted = True
+        with self._lock:
+            head = self._head
+            if head - self._tail >= self._capacity:
+                self.dropped += 1
+                accepted = False
+                if not self._drop_oldest:
+                    return False
+                self._tail += 1  # Evict the oldest to make room
+            slot = head % self._capacity
+            self._slots[slot, :len(audio)] = audio
+            self._lengths[slot] = len(audio)
+            self._head = head + 1
+        
+        self._ready.set()
+        return accepted
+    
+    def try_pop(self) -> Optional[np.ndarray]:
+        """Take the oldest segment (a copy), or None if the ring is empty."""
+        if self._tail == self._head:  # Cheap unlocked check for the idle case
+            return None
+        with self._lock:
+            tail = self._tail
+            if tail == self._head:
+                return None
+            slot = tail % self._capacity
+            audio = self._slots[slot, :self._lengths[slot]].copy()
+            self._tail = tail + 1
+        return audio
+    
+    def wait(self, timeout: float) -> bool:
+        """Block until a segment may be available (or timeout). Consumer only."""
+        if self._head != self._tail:
+            return True
+        self._ready.clear()
+        if self._head != self._tail:  # Pushed between the check and clear()
+            return True
+        return self._ready.wait(timeout)
+    
+    def clear(self) -> None:
+        """Discard all pending segments."""
+        with self._lock:
+            self._tail = self._head
+
+
 class StreamingAudioBuffer:
     """
     Manages audio buffering for real-time transcription.
@@ -51,6 +147,7 @@ class StreamingAudioBuffer:
         max_segment_duration: float = 10.0,
         speech_pad_ms: int = 200,  # Reduced for lower latency
         use_vad: bool = True,
+        hard_max_buffer_s: float = 30.0,
     ):
         """
         Initialize the streaming buffer.
@@ -62,12 +159,20 @@ class StreamingAudioBuffer:
             max_segment_duration: Maximum audio duration before forcing trigger (seconds)
             speech_pad_ms: Padding before/after speech segments (milliseconds)
             use_vad: Whether to use VAD for speech detection
+            hard_max_buffer_s: Absolute cap on buffered audio (seconds). Whisper's
+                              window is 30s, so anything longer is trimmed into
+                              a forced segment even if no flush ever triggers.
         """
         self.on_segment_ready = on_segment_ready
         self.min_segment_duration = min_segment_duration
         self.max_segment_duration = max_segment_duration
         self.speech_pad_ms = speech_pad_ms
         self.use_vad = use_vad
+        self.hard_max_buffer_s = hard_max_buffer_s
+        self._hard_max_samples = int(self.SAMPLE_RATE * hard_max_buffer_s)
+        # Forced segments keep the newest min_segment_duration seconds buffered
+        self._trim_samples = max(1, int(self.SAMPLE_RATE * (hard_max_buffer_s - min_segment_duration)))
+        self._forced_trims = 0
         
         # Buffer state
         self._buffer: List[np.ndarray] = []
@@ -90,9 +195,8 @@ class StreamingAudioBuffer:
             )
         
         # Pre-buffer for speech padding (reduced for lower latency)
-        self._pre_buffer: deque = deque(
-            maxlen=int(self.SAMPLE_RATE * speech_pad_ms / 1000)
-        )
+        self._pre_buffer = np.zeros(int(self.SAMPLE_RATE * speech_pad_ms / 1000), dtype=np.float32)
+        self._pre_buffer_len = 0  # Valid samples, stored at the end of _pre_buffer
         
         from ..logger import debug
         debug(f"Buffer: Initialized min={min_segment_duration}s, max={max_segment_duration}s, VAD={use_vad}")
@@ -101,6 +205,20 @@ class StreamingAudioBuffer:
         """Get current buffer duration in seconds."""
         return self._buffer_samples / self.SAMPLE_RATE
     
+    def _push_pre_buffer(self, audio: np.ndarray) -> None:
+        """Keep the most recent samples in the fixed-size pre-buffer. Caller must hold lock."""
+        capacity = len(self._pre_buffer)
+        if capacity == 0:
+            return
+        n = len(audio)
+        if n >= capacity:
+            self._pre_buffer[:] = audio[n - capacity:]
+        else:
+            # Shift the window left (overlapping copy is memmove-safe) and append
+            self._pre_buffer[:capacity - n] = self._pre_buffer[n:]
+            self._pre_buffer[capacity - n:] = audio
+        self._pre_buffer_len = min(capacity, self._pre_buffer_len + n)
+    
     def _flush_buffer_unlocked(self) -> Optional[np.ndarray]:
         """Flush the buffer and return accumulated audio. Caller must hold lock."""
         if not self._buffer:
@@ -112,14 +230,33 @@ class StreamingAudioBuffer:
         
         return audio
     
+    def _trim_buffer_unlocked(self) -> Optional[np.ndarray]:
+        """
+        Cut the oldest audio off a buffer that exceeds the hard cap. Caller must hold lock.
+        
+        Returns:
+            The oldest (hard_max - min_segment) seconds as a forced segment,
+            or None if the buffer is within the cap
+        """
+        if self._buffer_samples <= self._hard_max_samples:
+            return None
+        
+        audio = np.concatenate(self._buffer)
+        head = audio[:self._trim_samples]
+        tail = audio[self._trim_samples:]
+        self._buffer = [tail] if len(tail) else []
+        self._buffer_samples = len(tail)
+        self._forced_trims += 1
+        return head
+    
     def _trigger_transcription(self) -> None:
         """Trigger transcription with current buffer."""
         with self._lock:
             audio = self._flush_buffer_unlocked()
         if audio is not None and len(audio) > 0:
             # Add padding from pre-buffer if available
-            if self._pre_buffer:
-                pre_audio = np.array(list(self._pre_buffer), dtype=np.float32)
+            if self._pre_buffer_len:
+                pre_audio = self._pre_buffer[len(self._pre_buffer) - self._pre_buffer_len:]
                 audio = np.concatenate([pre_audio, audio])
             
             self.on_segment_ready(audio)
@@ -183,8 +320,20 @@ class StreamingAudioBuffer:
                         return
                 else:
                     # Update pre-buffer with recent silence (for padding)
-                    for sample in audio:
-                        self._pre_buffer.append(sample)
+                    self._push_pre_buffer(audio)
+        
+        # Enforce the hard cap (only reachable if max_segment_duration exceeds it)
+        with self._lock:
+            trimmed = self._trim_buffer_unlocked()
+        if trimmed is not None:
+            from ..logger import warning
+            warning(f"Buffer: Forced trim #{self._forced_trims} at {self.hard_max_buffer_s:.0f}s "
+                    f"({len(trimmed) / self.SAMPLE_RATE:.1f}s committed)")
+            threading.Thread(
+                target=self.on_segment_ready,
+                args=(trimmed,),
+                daemon=True,
+            ).start()
         
         # Check max duration (outside lock)
         buffer_duration = self._get_buffer_duration()
@@ -208,6 +357,11 @@ class StreamingAudioBuffer:
         # 1. Speech end (silence detected)
         # 2. Max duration reached
     
+    @property
+    def forced_trims(self) -> int:
+        """Number of times the hard buffer cap forced a segment out."""
+        return self._forced_trims
+    
     def reset(self) -> None:
         """Reset buffer state."""
         with self._lock:
@@ -216,7 +370,7 @@ class StreamingAudioBuffer:
             self._speech_started = False
             self._speech_start_time = None
             self._silence_start_time = None
-            self._pre_buffer.clear()
+            self._pre_buffer_len = 0
             
         if self._vad is not None:
             self._vad.reset()
@@ -271,6 +425,11 @@ class SimpleAudioBuffer:
                     daemon=True,
                 ).start()
     
+    @property
+    def forced_trims(self) -> int:
+        """Always 0: fixed-length segments never hit a buffer cap."""
+        return 0
+    
     def reset(self) -> None:
         """Reset buffer."""
         with self._lock:
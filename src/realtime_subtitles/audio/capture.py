@@ -5,11 +5,14 @@ This module captures audio output from the system (what you hear through speaker
 using Windows Audio Session API (WASAPI) in loopback mode.
 """
 
+import os
+import sys
 import threading
-import queue
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 import numpy as np
 
+from .resampler import PolyphaseResampler, TwoStageResampler, create_resampler
+
 try:
     import pyaudiowpatch as pyaudio
 except ImportError:
@@ -18,6 +21,26 @@ except ImportError:
         "Install it with: pip install PyAudioWPatch"
     )
 
+# Numba JIT for the downmix loop (optional)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _downmix_kernel(src: np.ndarray, channels: int, dst: np.ndarray) -> None:
+        """Average interleaved frames into dst in a single pass (no 2D temporary)."""
+        scale = np.float32(1.0 / channels)
+        for i in range(dst.shape[0]):
+            acc = np.float32(0.0)
+            base = i * channels
+            for c in range(channels):
+                acc += src[base + c]
+            dst[i] = acc * scale
+
 
 class AudioCapture:
     """
@@ -38,13 +61,20 @@ class AudioCapture:
     CHANNELS = 1  # Mono
     CHUNK_DURATION_MS = 100  # 100ms chunks for low latency
     
+    # Scheduling for the PortAudio callback thread
+    WIN_THREAD_PRIORITY_TIME_CRITICAL = 15
+    LINUX_FIFO_PRIORITY = 50
+    
     def __init__(self):
         self._pyaudio: Optional[pyaudio.PyAudio] = None
         self._stream: Optional[pyaudio.Stream] = None
         self._is_running = False
-        self._audio_queue: queue.Queue = queue.Queue()
+        self._priority_raised = False
+        self._device_rate = self.SAMPLE_RATE
+        self._channels = 1
+        self._mono: Optional[np.ndarray] = None  # Reused downmix output (when resampling)
         self._callback: Optional[Callable[[np.ndarray, int], None]] = None
-        self._capture_thread: Optional[threading.Thread] = None
+        self._resampler: Optional[Union[PolyphaseResampler, TwoStageResampler]] = None
         
     def _get_loopback_device(self) -> dict:
         """Find the WASAPI loopback device for the default output."""
@@ -70,47 +100,99 @@ class AudioCapture:
         """Calculate chunk size in frames based on device sample rate."""
         return int(device_rate * self.CHUNK_DURATION_MS / 1000)
     
+    def _downmix(self, audio: np.ndarray, channels: int) -> np.ndarray:
+        """Convert interleaved multi-channel audio to mono."""
+        if not NUMBA_AVAILABLE:
+            if channels == 2:
+                # Common loopback case: two strided views, one add, in-place scale
+                mono = np.add(audio[0::2], audio[1::2])
+                mono *= 0.5
+                return mono
+            return audio.reshape(-1, channels).mean(axis=1)
+        
+        frames = len(audio) // channels
+        # The resampler copies its input, so the downmix buffer can be reused;
+        # without resampling the result goes straight to the user callback.
+        if self._resampler is not None and self._mono is not None and len(self._mono) >= frames:
+            dst = self._mono[:frames]
+        else:
+            dst = np.empty(frames, dtype=np.float32)
+        _downmix_kernel(audio, channels, dst)
+        return dst
+    
     def _resample(self, audio: np.ndarray, original_rate: int) -> np.ndarray:
-        """Resample audio to target sample rate using linear interpolation."""
-        if original_rate == self.SAMPLE_RATE:
+        """Resample audio to target sample rate using the streaming FIR resampler."""
+        if original_rate == self.SAMPLE_RATE or self._resampler is None:
             return audio
-            
-        # Simple resampling using numpy interpolation
-        duration = len(audio) / original_rate
-        target_length = int(duration * self.SAMPLE_RATE)
         
-        if target_length == 0:
-            return np.array([], dtype=np.float32)
-            
-        indices = np.linspace(0, len(audio) - 1, target_length)
-        return np.interp(indices, np.arange(len(audio)), audio).astype(np.float32)
+        return self._resampler.process(audio)
     
-    def _audio_callback(self, in_data, frame_count, time_info, status):
-        """PyAudio callback - runs in separate thread."""
-        self._audio_queue.put(in_data)
-        return (None, pyaudio.paContinue)
+    def _raise_thread_priority(self) -> None:
+        """
+        Raise the scheduling priority of the calling (PortAudio callback) thread.
+        
+        Reduces preemption jitter under CPU load. Best effort: failures (e.g.
+        no permission for SCHED_FIFO on Linux) leave the default priority.
+        """
+        try:
+            if sys.platform == "win32":
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                ok = kernel32.SetThreadPriority(
+                    kernel32.GetCurrentThread(), self.WIN_THREAD_PRIORITY_TIME_CRITICAL
+                )
+                if not ok:
+                    raise OSError(f"SetThreadPriority failed ({kernel32.GetLastError()})")
+            elif hasattr(os, "sched_setscheduler"):
+                os.sched_setscheduler(
+                    threading.get_native_id(),
+                    os.SCHED_FIFO,
+                    os.sched_param(self.LINUX_FIFO_PRIORITY),
+                )
+            else:
+                return
+            print("[AudioCapture] Raised callback thread priority")
+        except (OSError, AttributeError) as e:
+            print(f"[AudioCapture] Could not raise callback thread priority: {e}")
     
-    def _process_audio_loop(self, device_rate: int, channels: int):
-        """Main loop for processing captured audio."""
-        while self._is_running:
-            try:
-                raw_data = self._audio_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
-                
-            # Convert bytes to numpy array
-            audio = np.frombuffer(raw_data, dtype=np.float32)
-            
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """
+        PyAudio callback - runs on the PortAudio thread.
+        
+        Downmix and resampling take well under a millisecond per 100ms chunk,
+        so they run here and the user callback is invoked directly, without
+        a handoff to a separate processing thread.
+        """
+        if not self._is_running:
+            return (None, pyaudio.paComplete)
+        
+        # The callback thread is owned by PortAudio, so its priority can
+        # only be changed from inside the first callback
+        if not self._priority_raised:
+            self._priority_raised = True
+            self._raise_thread_priority()
+        
+        # Zero-copy view of the callback buffer (owned by this bytes object,
+        # never reused by PyAudio, so it is safe to pass on)
+        audio = np.frombuffer(in_data, dtype=np.float32)
+        
+        try:
             # Convert stereo to mono if needed
-            if channels > 1:
-                audio = audio.reshape(-1, channels).mean(axis=1)
+            if self._channels > 1:
+                audio = self._downmix(audio, self._channels)
             
             # Resample to 16kHz
-            audio = self._resample(audio, device_rate)
+            audio = self._resample(audio, self._device_rate)
             
-            # Call user callback
+            # Call user callback (read-only: consumers must copy, never modify)
             if self._callback and len(audio) > 0:
+                audio.flags.writeable = False
                 self._callback(audio, self.SAMPLE_RATE)
+        except Exception as e:
+            # Keep the stream alive; an exception here would abort it
+            print(f"[AudioCapture] Callback error: {e}")
+        
+        return (None, pyaudio.paContinue)
     
     def start(self, callback: Callable[[np.ndarray, int], None]) -> None:
         """
@@ -118,13 +200,16 @@ class AudioCapture:
         
         Args:
             callback: Function called with (audio_chunk: np.ndarray, sample_rate: int)
-                     for each captured audio chunk.
+                     for each captured audio chunk. The chunk is a read-only
+                     float32 mono array that is never reused by the capture, so
+                     it may be kept by reference but must not be modified.
         """
         if self._is_running:
             return
             
         self._callback = callback
         self._is_running = True
+        self._priority_raised = False
         
         # Initialize PyAudio
         if self._pyaudio is None:
@@ -136,9 +221,22 @@ class AudioCapture:
         channels = int(device["maxInputChannels"])
         chunk_size = self._calculate_chunk_size(device_rate)
         
+        # Build resampler once for the device rate (filter state persists across chunks).
+        # 48kHz uses the two-stage half-band + 2/3 chain, other rates a single polyphase stage.
+        self._resampler = None
+        if device_rate != self.SAMPLE_RATE:
+            self._resampler = create_resampler(device_rate, self.SAMPLE_RATE)
+        
         print(f"[AudioCapture] Using device: {device['name']}")
         print(f"[AudioCapture] Device rate: {device_rate}Hz, Channels: {channels}")
         print(f"[AudioCapture] Chunk size: {chunk_size} frames ({self.CHUNK_DURATION_MS}ms)")
+        if self._resampler is not None:
+            print(f"[AudioCapture] Resampling {device_rate}Hz -> {self.SAMPLE_RATE}Hz "
+                  f"(L={self._resampler.up}, M={self._resampler.down})")
+        
+        self._device_rate = device_rate
+        self._channels = channels
+        self._mono = np.empty(chunk_size, dtype=np.float32) if channels > 1 else None
         
         # Open stream
         self._stream = self._pyaudio.open(
@@ -151,14 +249,6 @@ class AudioCapture:
             stream_callback=self._audio_callback,
         )
         
-        # Start processing thread
-        self._capture_thread = threading.Thread(
-            target=self._process_audio_loop,
-            args=(device_rate, channels),
-            daemon=True
-        )
-        self._capture_thread.start()
-        
         self._stream.start_stream()
         print("[AudioCapture] Started capturing system audio")
     
@@ -171,20 +261,9 @@ class AudioCapture:
             self._stream.close()
             self._stream = None
             
-        if self._capture_thread:
-            self._capture_thread.join(timeout=1.0)
-            self._capture_thread = None
-            
         if self._pyaudio:
             self._pyaudio.terminate()
             self._pyaudio = None
-            
-        # Clear queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
                 
         print("[AudioCapture] Stopped")
     
@@ -198,12 +277,14 @@ class AudioCapture:
 
 # Quick test
 if __name__ == "__main__":
+    import math
     import time
     
     def on_audio(audio: np.ndarray, sample_rate: int):
-        # Calculate audio level (RMS)
-        rms = np.sqrt(np.mean(audio ** 2))
-        db = 20 * np.log10(max(rms, 1e-10))
+        # Calculate audio level (RMS) - dot product avoids an audio**2 temporary
+        sum_squares = float(np.dot(audio, audio))
+        rms = math.sqrt(sum_squares / len(audio))
+        db = 20 * math.log10(max(rms, 1e-10))
         bars = int(max(0, (db + 60) / 2))  # -60dB to 0dB -> 0 to 30 bars
         print(f"\r[{'█' * bars}{' ' * (30 - bars)}] {db:6.1f} dB", end="", flush=True)
     
@@ -0,0 +1,259 @@
+"""
+Streaming sample-rate conversion for captured audio.
+
+Implements a rational (L/M) polyphase FIR resampler and a two-stage
+half-band + polyphase chain for 3:1 conversions (48kHz -> 16kHz). The filter
+history is kept between calls so consecutive capture chunks are converted
+without seams at the chunk boundaries.
+"""
+
+from math import gcd
+from typing import Dict, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def design_lowpass(num_taps: int, cutoff: float, beta: float) -> np.ndarray:
+    """
+    Design a Kaiser-windowed sinc lowpass filter.
+
+    Args:
+        num_taps: Filter length (odd for a symmetric, integer-delay filter)
+        cutoff: Cutoff frequency relative to Nyquist (0-1)
+        beta: Kaiser window shape parameter
+
+    Returns:
+        Filter taps normalized to unity DC gain
+    """
+    n = np.arange(num_taps) - (num_taps - 1) / 2
+    taps = cutoff * np.sinc(cutoff * n) * np.kaiser(num_taps, beta)
+    return taps / taps.sum()
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational resampler using a polyphase FIR filter.
+
+    Conceptually the input is upsampled by L, lowpass filtered and
+    decimated by M. Only the taps that hit non-zero input samples are
+    evaluated, so each output sample costs ``num_taps / L`` multiply-adds.
+
+    Example:
+        >>> resampler = PolyphaseResampler(44100, 16000)
+        >>> out = resampler.process(chunk)  # Called repeatedly
+    """
+
+    ZERO_CROSSINGS = 10  # Filter half-length in zero crossings of the sinc
+    KAISER_BETA = 8.6  # Stopband attenuation ~90dB
+    MAX_CACHED_TABLES = 64  # Bound on cached index tables (chunk sizes are normally fixed)
+
+    def __init__(self, orig_rate: int, target_rate: int):
+        """
+        Initialize the resampler.
+
+        Args:
+            orig_rate: Input sample rate in Hz
+            target_rate: Output sample rate in Hz
+        """
+        g = gcd(orig_rate, target_rate)
+        self.up = target_rate // g
+        self.down = orig_rate // g
+
+        # Lowpass at the lower of the two Nyquist frequencies (in the upsampled domain)
+        max_factor = max(self.up, self.down)
+        num_taps = 2 * self.ZERO_CROSSINGS * max_factor + 1
+        taps = design_lowpass(num_taps, 1.0 / max_factor, self.KAISER_BETA) * self.up
+
+        # Split into L sub-filters of equal length: phases[p, j] = taps[p + j*L].
+        # Reversed so each output is a plain dot product with an input window.
+        taps_per_phase = -(-num_taps // self.up)
+        padded = np.zeros(taps_per_phase * self.up, dtype=np.float32)
+        padded[:num_taps] = taps
+        self._phases = np.ascontiguousarray(padded.reshape(taps_per_phase, self.up).T[:, ::-1])
+        self._taps_per_phase = taps_per_phase
+
+        # Stream state
+        self._history = np.zeros(taps_per_phase - 1, dtype=np.float32)
+        self._offset = 0  # Upsampled position of the next output, relative to the chunk start
+
+        # Gather index tables keyed on (chunk length, offset). With a fixed
+        # capture chunk size the offset cycles through at most L values, so
+        # after the first few chunks no index arrays are built per call.
+        self._index_cache: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _index_tables(self, n: int, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the window and phase indices for the outputs of one chunk.
+
+        Args:
+            n: Input chunk length
+            count: Number of outputs produced from the chunk
+
+        Returns:
+            (window_idx, phase_idx) int32 arrays of length count
+        """
+        key = (n, self._offset)
+        tables = self._index_cache.get(key)
+        if tables is None:
+            pos = self._offset + self.down * np.arange(count, dtype=np.int64)
+            tables = ((pos // self.up).astype(np.int32), (pos % self.up).astype(np.int32))
+            if len(self._index_cache) >= self.MAX_CACHED_TABLES:
+                self._index_cache.clear()
+            self._index_cache[key] = tables
+        return tables
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk of a continuous stream.
+
+        Args:
+            audio: Input samples as float32 numpy array
+
+        Returns:
+            Resampled float32 audio (length varies slightly between calls)
+        """
+        n = len(audio)
+        up, down = self.up, self.down
+        buf = np.concatenate((self._history, audio))
+
+        # Number of outputs whose newest input sample falls inside this chunk
+        count = max(0, (up * n - 1 - self._offset) // down + 1)
+
+        if count > 0 and up == 1:
+            # Integer decimation (e.g. 32kHz/64kHz -> 16kHz): a single phase,
+            # so the windows are a strided view and the filter is one matvec
+            windows = sliding_window_view(buf, self._taps_per_phase)[self._offset::down][:count]
+            out = windows @ self._phases[0]
+        elif count > 0:
+            window_idx, phase_idx = self._index_tables(n, count)
+            windows = sliding_window_view(buf, self._taps_per_phase)[window_idx]
+            out = np.einsum("ij,ij->i", windows, self._phases[phase_idx])
+        else:
+            out = np.empty(0, dtype=np.float32)
+
+        self._offset += down * count - up * n
+        if len(self._history):
+            self._history = buf[len(buf) - len(self._history):].copy()
+
+        return out.astype(np.float32, copy=False)
+
+    def reset(self) -> None:
+        """Reset the filter state (e.g. when the stream restarts)."""
+        self._history[:] = 0
+        self._offset = 0
+
+
+class HalfBandDecimator:
+    """
+    Streaming decimate-by-2 stage using a half-band FIR filter.
+
+    A half-band filter has every other tap equal to zero (except the center),
+    so one polyphase branch collapses to a single scaled sample and the
+    other holds all the work - half the multiply-adds of a generic filter.
+    """
+
+    HALF_LENGTH = 12  # Non-zero taps on each side of the center
+    KAISER_BETA = 8.6
+
+    def __init__(self):
+        """Initialize the decimator."""
+        num_taps = 4 * self.HALF_LENGTH - 1
+        taps = design_lowpass(num_taps, 0.5, self.KAISER_BETA).astype(np.float32)
+        center = (num_taps - 1) // 2
+
+        # Odd offsets from the center land on even indices; reversed for dot products
+        self._even_taps = np.ascontiguousarray(taps[::2][::-1])
+        self._center_tap = float(taps[center])
+        self._center = center
+
+        # Stream state
+        self._history = np.zeros(num_taps - 1, dtype=np.float32)
+        self._offset = 0  # Index of the next output's newest sample, relative to the chunk start
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Decimate the next chunk of a continuous stream by 2.
+
+        Args:
+            audio: Input samples as float32 numpy array
+
+        Returns:
+            Filtered and decimated float32 audio
+        """
+        n = len(audio)
+        buf = np.concatenate((self._history, audio))
+        count = max(0, (n - 1 - self._offset) // 2 + 1)
+
+        if count > 0:
+            # Non-zero branch: every other sample of each window
+            branch = buf[self._offset::2]
+            windows = sliding_window_view(branch, len(self._even_taps))[:count]
+            out = windows @ self._even_taps
+            # Center tap: a single delayed sample
+            start = self._offset + self._center
+            out += self._center_tap * buf[start:start + 2 * count:2]
+        else:
+            out = np.empty(0, dtype=np.float32)
+
+        self._offset += 2 * count - n
+        self._history = buf[len(buf) - len(self._history):].copy()
+
+        return out.astype(np.float32, copy=False)
+
+    def reset(self) -> None:
+        """Reset the filter state."""
+        self._history[:] = 0
+        self._offset = 0
+
+
+class TwoStageResampler:
+    """
+    3:1 resampler built from a half-band decimator and a 2/3 polyphase stage.
+
+    The wideband 2/3 stage runs at half the input rate, so the expensive
+    narrow transition band is computed on half as many samples as a
+    single-stage 1/3 design would need.
+    """
+
+    def __init__(self, orig_rate: int, target_rate: int):
+        """
+        Initialize the resampler.
+
+        Args:
+            orig_rate: Input sample rate in Hz (must be 3x target_rate)
+            target_rate: Output sample rate in Hz
+        """
+        if orig_rate != 3 * target_rate:
+            raise ValueError(f"TwoStageResampler needs a 3:1 ratio, got {orig_rate}->{target_rate}")
+
+        self._hb = HalfBandDecimator()
+        self._wb = PolyphaseResampler(orig_rate // 2, target_rate)
+        self.up = 1
+        self.down = 3
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """Resample the next chunk of a continuous stream."""
+        return self._wb.process(self._hb.process(audio))
+
+    def reset(self) -> None:
+        """Reset the filter state of both stages."""
+        self._hb.reset()
+        self._wb.reset()
+
+
+def create_resampler(orig_rate: int, target_rate: int) -> Union[PolyphaseResampler, TwoStageResampler]:
+    """
+    Create the most efficient streaming resampler for a rate pair.
+
+    Args:
+        orig_rate: Input sample rate in Hz
+        target_rate: Output sample rate in Hz
+
+    Returns:
+        TwoStageResampler for 3:1 ratios (e.g. 48kHz -> 16kHz),
+        PolyphaseResampler otherwise
+    """
+    if orig_rate == 3 * target_rate:
+        return TwoStageResampler(orig_rate, target_rate)
+    return PolyphaseResampler(orig_rate, target_rate)
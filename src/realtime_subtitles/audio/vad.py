@@ -4,10 +4,14 @@ Voice Activity Detection (VAD) using Silero VAD.
 Simplified implementation that works with any audio chunk size.
 """
 
+import importlib.util
 import numpy as np
-from typing import Optional
+from typing import List, Optional
 import torch
 
+# ONNX Runtime backend (optional, preferred when installed)
+ONNXRUNTIME_AVAILABLE = importlib.util.find_spec("onnxruntime") is not None
+
 
 class VoiceActivityDetector:
     """
@@ -19,12 +23,15 @@ class VoiceActivityDetector:
     
     SAMPLE_RATE = 16000
     CHUNK_SIZE = 512  # Silero VAD requires exactly 512 samples for 16kHz
+    CHUNK_DURATION_MS = CHUNK_SIZE * 1000 // SAMPLE_RATE  # 32ms, exact
     
     def __init__(
         self,
         threshold: float = 0.4,
         min_speech_duration_ms: int = 150,
         min_silence_duration_ms: int = 300,
+        use_onnx: bool = True,
+        device: str = "cpu",
     ):
         """
         Initialize the VAD.
@@ -33,51 +40,144 @@ class VoiceActivityDetector:
             threshold: Speech probability threshold (0-1). Lower = more sensitive.
             min_speech_duration_ms: Minimum speech duration to trigger speech state.
             min_silence_duration_ms: Minimum silence duration to end speech state.
+            use_onnx: Run the model with ONNX Runtime if it is installed
+                     (falls back to PyTorch otherwise).
+            device: Device for the PyTorch backend ("cpu", "cuda" or "auto").
+                   Ignored by the ONNX backend, which always runs on CPU.
         """
         self.threshold = threshold
-        self.min_speech_duration_ms = min_speech_duration_ms
-        self.min_silence_duration_ms = min_silence_duration_ms
+        self.min_speech_duration_ms = int(min_speech_duration_ms)
+        self.min_silence_duration_ms = int(min_silence_duration_ms)
         
         # State
         self._is_speech = False
         self._speech_ms = 0
         self._silence_ms = 0
         
-        # Audio buffer
-        self._buffer = np.array([], dtype=np.float32)
+        # Carry-over for an incomplete chunk (only the first _buffer_len samples are valid)
+        self._buffer = np.empty(self.CHUNK_SIZE, dtype=np.float32)
+        self._buffer_len = 0
         
         # Model
         self._model = None
+        self._backend = "onnx" if use_onnx and ONNXRUNTIME_AVAILABLE else "torch"
+        self._device = self._resolve_device(device)
+        
+        # Persistent model input (shares storage with a numpy view, so new
+        # chunks are copied in place instead of allocating a tensor per call).
+        # On GPU the host tensor is mirrored by a persistent device tensor.
+        use_cuda = self._device.startswith("cuda")
+        self._input = torch.empty(self.CHUNK_SIZE, dtype=torch.float32)
+        self._input_np = self._input.numpy()
+        self._model_input = (
+            torch.empty(self.CHUNK_SIZE, dtype=torch.float32, device=self._device)
+            if use_cuda else self._input
+        )
+        
         self._load_model()
     
+    def _resolve_device(self, device: str) -> str:
+        """Pick the inference device ("auto" prefers CUDA when available)."""
+        if self._backend != "torch":
+            return "cpu"
+        if device == "auto":
+            return "cuda" if torch.cuda.is_available() else "cpu"
+        if device.startswith("cuda") and not torch.cuda.is_available():
+            from ..logger import warning
+            warning("VAD: CUDA requested but not available, using CPU")
+            return "cpu"
+        return device
+    
     def _load_model(self) -> None:
         """Load Silero VAD model."""
         from ..logger import info
-        info("VAD: Loading Silero VAD model...")
+        info(f"VAD: Loading Silero VAD model ({self._backend})...")
         
+        # The ONNX wrapper runs a single-threaded CPU session (a 512-sample
+        # chunk is far too small to benefit from intra-op threads) and
+        # skips PyTorch's eager dispatch. It keeps the same call interface.
         self._model, _ = torch.hub.load(
             repo_or_dir='snakers4/silero-vad',
             model='silero_vad',
             force_reload=False,
-            onnx=False,
+            onnx=self._backend == "onnx",
+            force_onnx_cpu=True,
             trust_repo=True,
         )
+        if self._device != "cpu":
+            self._model.to(self._device)
+        elif self._backend == "torch":
+            self._model = self._optimize_for_inference(self._model)
         self._model.reset_states()
         
-        info("VAD: Silero VAD model loaded")
+        info(f"VAD: Silero VAD model loaded on {self._device}")
+    
+    def _optimize_for_inference(self, model):
+        """
+        Freeze the TorchScript model and apply inference graph passes.
+        
+        The packaged model is already scripted, so it is frozen rather than
+        re-traced (tracing would bake in the sample-rate branch and the
+        recurrent state handling). reset_states is kept as an extra method.
+        Falls back to the original model if the passes are not supported.
+        """
+        from ..logger import debug
+        if not isinstance(model, torch.jit.ScriptModule):
+            return model
+        try:
+            optimized = torch.jit.optimize_for_inference(
+                model.eval(), other_methods=["reset_states"]
+            )
+            # Sanity check before swapping in the optimized graph
+            with torch.inference_mode():
+                optimized.reset_states()
+                optimized(torch.zeros(self.CHUNK_SIZE), self.SAMPLE_RATE)
+            return optimized
+        except Exception as e:
+            debug(f"VAD: optimize_for_inference not applied ({e})")
+            return model
+    
+    def _upload(self) -> torch.Tensor:
+        """Return the model input, copying the staged chunk to the device if needed."""
+        if self._model_input is self._input:
+            return self._input
+        # Blocking copy: the host buffer is overwritten with the next chunk
+        # right after this returns, so an async copy could read torn data
+        self._model_input.copy_(self._input)
+        return self._model_input
     
     def _get_probability(self, chunk: np.ndarray) -> float:
         """Get speech probability for a 512-sample chunk."""
         if len(chunk) != self.CHUNK_SIZE:
             return 0.0
         
-        tensor = torch.from_numpy(chunk.astype(np.float32))
+        self._input_np[:] = chunk
         
-        with torch.no_grad():
-            prob = self._model(tensor, self.SAMPLE_RATE).item()
+        with torch.inference_mode():
+            prob = self._model(self._upload(), self.SAMPLE_RATE).item()
         
         return prob
     
+    def _get_probabilities(self, chunks: List[np.ndarray]) -> List[float]:
+        """
+        Get speech probabilities for consecutive 512-sample chunks.
+        
+        Silero VAD is recurrent, so consecutive chunks of one stream must be
+        evaluated in order (the batch dimension means independent streams).
+        All chunks run inside a single inference_mode block and the results are
+        converted to Python floats once, instead of one .item() sync per chunk.
+        """
+        if len(chunks) == 1:
+            return [self._get_probability(chunks[0])]
+        
+        outputs = []
+        with torch.inference_mode():
+            for chunk in chunks:
+                self._input_np[:] = chunk
+                outputs.append(self._model(self._upload(), self.SAMPLE_RATE))
+        
+        return torch.cat([out.reshape(-1) for out in outputs]).tolist()
+    
     def is_speech(self, audio: np.ndarray) -> bool:
         """
         Check if audio contains speech.
@@ -91,35 +191,67 @@ class VoiceActivityDetector:
         Returns:
             True if currently in speech state
         """
-        # Accumulate audio
-        self._buffer = np.concatenate([
-            self._buffer,
-            audio.astype(np.float32)
-        ])
-        
-        # Process all complete chunks
-        chunk_duration_ms = (self.CHUNK_SIZE / self.SAMPLE_RATE) * 1000  # 32ms
-        
-        while len(self._buffer) >= self.CHUNK_SIZE:
-            chunk = self._buffer[:self.CHUNK_SIZE]
-            self._buffer = self._buffer[self.CHUNK_SIZE:]
-            
-            prob = self._get_probability(chunk)
-            
-            if prob >= self.threshold:
+        # Chunks are taken straight from the caller's array (views, no copy);
+        # only the samples that straddle a call boundary go through _buffer.
+        audio = np.asarray(audio, dtype=np.float32)
+        n = len(audio)
+        size = self.CHUNK_SIZE
+        buffer = self._buffer
+        pending = self._buffer_len
+        chunks = []
+        pos = 0
+        
+        if pending:
+            # Complete the chunk left over from the previous call
+            pos = min(size - pending, n)
+            buffer[pending:pending + pos] = audio[:pos]
+            pending += pos
+            if pending == size:
+                chunks.append(buffer)
+                pending = 0
+        
+        num_full = (n - pos) // size
+        end = pos + num_full * size
+        chunks.extend(audio[i:i + size] for i in range(pos, end, size))
+        
+        probs = self._get_probabilities(chunks) if chunks else []
+        
+        # Keep the incomplete tail (< CHUNK_SIZE samples) for the next call.
+        # Done after inference, which may still be reading _buffer.
+        if end < n:
+            tail = n - end
+            buffer[pending:pending + tail] = audio[end:]
+            pending += tail
+        self._buffer_len = pending
+        
+        # Hysteresis on fast locals; durations are whole milliseconds
+        threshold = self.threshold
+        min_speech_ms = self.min_speech_duration_ms
+        min_silence_ms = self.min_silence_duration_ms
+        dur = self.CHUNK_DURATION_MS
+        is_speech = self._is_speech
+        speech_ms = self._speech_ms
+        silence_ms = self._silence_ms
+        
+        for prob in probs:
+            if prob >= threshold:
                 # Speech detected
-                self._speech_ms += chunk_duration_ms
-                self._silence_ms = 0
+                speech_ms += dur
+                silence_ms = 0
                 
-                if self._speech_ms >= self.min_speech_duration_ms:
-                    self._is_speech = True
+                if speech_ms >= min_speech_ms:
+                    is_speech = True
             else:
                 # Silence detected
-                self._silence_ms += chunk_duration_ms
+                silence_ms += dur
                 
-                if self._silence_ms >= self.min_silence_duration_ms:
-                    self._is_speech = False
-                    self._speech_ms = 0
+                if silence_ms >= min_silence_ms:
+                    is_speech = False
+                    speech_ms = 0
+        
+        self._is_speech = is_speech
+        self._speech_ms = speech_ms
+        self._silence_ms = silence_ms
         
         return self._is_speech
     
@@ -128,6 +260,6 @@ class VoiceActivityDetector:
         self._is_speech = False
         self._speech_ms = 0
         self._silence_ms = 0
-        self._buffer = np.array([], dtype=np.float32)
+        self._buffer_len = 0
         if self._model is not None:
             self._model.reset_states()
@@ -4,7 +4,10 @@ Internationalization (i18n) module for Real-time Subtitles.
 Provides multi-language support for the UI.
 """
 
-from typing import Dict, Optional
+import sys
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from realtime_subtitles.settings_manager import get_settings_manager
 
 # Import translation modules
@@ -24,7 +27,50 @@ DEFAULT_LANGUAGE = "zh_CN"
 
 # Current language cache
 _current_language: Optional[str] = None
-_translations: Dict[str, str] = {}
+
+# Position of each language in the per-key tuples of _ALL
+_LANG_IDX: Dict[str, int] = {code: i for i, code in enumerate(LANGUAGES)}
+_current_idx: Optional[int] = None
+
+# A precompiled entry is (text, fields). fields is None for plain strings,
+# otherwise the parsed format tokens (literal, field_name) so get_text()
+# never re-parses a template.
+_Entry = Tuple[str, Optional[List[Tuple[str, Optional[str]]]]]
+
+
+def _compile_template(text: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+    """Parse a format template into (literal, field_name) tokens, or None if plain."""
+    if "{" not in text and "}" not in text:
+        return None
+    try:
+        parsed = list(Formatter().parse(text))
+    except ValueError:
+        return None
+    tokens = []
+    for literal, field, spec, conversion in parsed:
+        # Only plain "{name}" fields take the fast path; anything fancier
+        # (format specs, conversions, attribute access) uses str.format
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        tokens.append((literal, field))
+    return tokens
+
+
+def _build_table() -> Dict[str, Tuple[Optional[_Entry], ...]]:
+    """Compile every language into key -> (entry per language), None where a key is missing."""
+    tables = [translations for _, translations in LANGUAGES.values()]
+    keys = set().union(*tables)
+    return {
+        sys.intern(key): tuple(
+            (table[key], _compile_template(table[key])) if key in table else None
+            for table in tables
+        )
+        for key in keys
+    }
+
+
+# All languages, compiled once at import (read-only)
+_ALL: Mapping[str, Tuple[Optional[_Entry], ...]] = MappingProxyType(_build_table())
 
 
 def get_current_language() -> str:
@@ -43,13 +89,13 @@ def set_language(lang_code: str) -> None:
     Args:
         lang_code: Language code (zh_TW, zh_CN, en)
     """
-    global _current_language, _translations
+    global _current_language, _current_idx
     
     if lang_code not in LANGUAGES:
         lang_code = DEFAULT_LANGUAGE
     
     _current_language = lang_code
-    _translations = LANGUAGES[lang_code][1]
+    _current_idx = _LANG_IDX[lang_code]
     
     # Save to settings
     settings = get_settings_manager()
@@ -68,21 +114,35 @@ def get_text(key: str, **kwargs) -> str:
     Returns:
         Translated string, or key if not found
     """
-    global _translations
+    global _current_idx
     
-    # Initialize translations if not loaded
-    if not _translations:
-        lang = get_current_language()
-        _translations = LANGUAGES.get(lang, LANGUAGES[DEFAULT_LANGUAGE])[1]
+    # Resolve the language index on first use
+    if _current_idx is None:
+        _current_idx = _LANG_IDX.get(get_current_language(), _LANG_IDX[DEFAULT_LANGUAGE])
     
-    text = _translations.get(key, key)
+    row = _ALL.get(key)
+    entry = None if row is None else row[_current_idx]
+    if entry is None:
+        text = key
+        fields = _compile_template(key) if kwargs else None
+    else:
+        text, fields = entry
     
     # Apply format arguments if provided
     if kwargs:
-        try:
-            text = text.format(**kwargs)
-        except KeyError:
-            pass
+        if fields is not None:
+            try:
+                text = "".join([
+                    literal if field is None else literal + str(kwargs[field])
+                    for literal, field in fields
+                ])
+            except KeyError:
+                pass
+        elif "{" in text or "}" in text:
+            try:
+                text = text.format(**kwargs)
+            except KeyError:
+                pass
     
     return text
 
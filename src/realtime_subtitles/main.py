@@ -5,7 +5,8 @@ Run with: python -m realtime_subtitles.main
 """
 
 import sys
-import time
+import signal
+import threading
 import argparse
 from typing import Optional
 
@@ -73,7 +74,11 @@ def main():
     
     # Subtitle callback
     def on_subtitle(event: SubtitleEvent):
-        print(f"[{event.language}] {event.text}")
+        # Translations arrive as a follow-up event for the same segment
+        if event.translated_text:
+            print(f"    -> {event.translated_text}")
+        else:
+            print(f"[{event.language}] {event.text}")
     
     # Create and run pipeline
     pipeline = RealtimePipeline(
@@ -85,11 +90,21 @@ def main():
         on_subtitle=on_subtitle,
     )
     
+    # Ctrl+C just sets an event, so the main thread sleeps instead of polling.
+    # The wait still times out once a second: on Windows an untimed wait
+    # cannot be interrupted by the signal handler.
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    
     try:
-        pipeline.start()
-        while True:
-            time.sleep(0.1)
-    except KeyboardInterrupt:
+        # Models load in the background: wait in timed steps so Ctrl+C during
+        # loading/downloading is noticed instead of blocking in start()
+        while not (pipeline.wait_ready(1.0) or stop_event.is_set()):
+            pass
+        if not stop_event.is_set():
+            pipeline.start()
+            while not stop_event.wait(1.0):
+                pass
         print("\n\nStopping...")
     finally:
         pipeline.stop()
@@ -2,13 +2,17 @@
 Model Manager module - Handles model downloading and management.
 """
 
-from .manager import (
-    ModelManager,
-    ModelInfo,
-    ModelType,
-    ModelStatus,
-    SUPPORTED_MODELS,
-)
+import importlib
+
+# Imported on first access (PEP 562) so importing the package stays cheap
+_LAZY_IMPORTS = {
+    "ModelManager": ".manager",
+    "ModelInfo": ".manager",
+    "ModelType": ".manager",
+    "ModelStatus": ".manager",
+    "SUPPORTED_MODELS": ".manager",
+    "get_model_manager": ".manager",
+}
 
 __all__ = [
     "ModelManager",
@@ -16,4 +20,18 @@ __all__ = [
     "ModelType",
     "ModelStatus",
     "SUPPORTED_MODELS",
+    "get_model_manager",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
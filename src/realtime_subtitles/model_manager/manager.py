@@ -3,10 +3,11 @@ Model Manager - Handles model downloading and status checking.
 """
 
 import os
-from dataclasses import dataclass
+import shutil
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, List, Tuple
 import threading
 
 from ..i18n import t
@@ -28,6 +29,32 @@ class ModelStatus(Enum):
     ERROR = "error"
 
 
+class DownloadCancelled(Exception):
+    """Raised inside a download thread when its download was cancelled."""
+
+
+@dataclass
+class _DownloadJob:
+    """One download run of a model and everyone listening to it."""
+    thread: Optional[threading.Thread] = None
+    cancel: threading.Event = field(default_factory=threading.Event)
+    progress_listeners: List[Callable[[str, float, str], None]] = field(default_factory=list)
+    complete_listeners: List[Callable[[str, bool], None]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    
+    def report(self, model_id: str, progress: float, status_text: str) -> None:
+        """Forward a progress tick to every listener (download thread)."""
+        with self.lock:
+            listeners = list(self.progress_listeners)
+        for listener in listeners:
+            listener(model_id, progress, status_text)
+    
+    def check_cancelled(self, model_id: str) -> None:
+        """Raise DownloadCancelled if this run was cancelled."""
+        if self.cancel.is_set():
+            raise DownloadCancelled(model_id)
+
+
 @dataclass
 class ModelInfo:
     """Information about a model."""
@@ -116,20 +143,33 @@ SUPPORTED_MODELS: List[ModelInfo] = [
 class ModelManager:
     """Manages model downloading and status."""
     
-    def __init__(self, models_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        models_dir: Optional[Path] = None,
+        max_concurrent_downloads: Optional[int] = None,
+    ):
         """
         Initialize the model manager.
         
         Args:
             models_dir: Directory to store models. If None, uses default cache locations.
+            max_concurrent_downloads: Most downloads that transfer at once; further
+                ones wait their turn. Defaults to min(4, CPU count).
         """
         self.models_dir = models_dir or self._get_default_models_dir()
         self.models_dir.mkdir(parents=True, exist_ok=True)
         
         # Download state
         self._download_progress: Dict[str, float] = {}
-        self._download_threads: Dict[str, threading.Thread] = {}
-        self._download_callbacks: Dict[str, Callable[[str, float, str], None]] = {}
+        # Current download run per model id; replaced when a cancelled run is restarted
+        self._downloads: Dict[str, _DownloadJob] = {}
+        self._downloads_lock = threading.Lock()
+        if max_concurrent_downloads is None:
+            max_concurrent_downloads = min(4, os.cpu_count() or 2)
+        self._download_slots = threading.BoundedSemaphore(max_concurrent_downloads)
+        
+        # Status cache: model id -> (mtime of the model folder, status)
+        self._status_cache: Dict[str, Tuple[float, ModelStatus]] = {}
     
     @staticmethod
     def _get_default_models_dir() -> Path:
@@ -148,16 +188,71 @@ class ModelManager:
         return self.models_dir / model.id
     
     def get_status(self, model: ModelInfo) -> ModelStatus:
-        """Check if a model is downloaded."""
+        """
+        Check if a model is downloaded.
+        
+        The result is cached per model and reused while the model folder's
+        mtime is unchanged (files added to or removed from it update the
+        mtime), so repeated checks cost one stat instead of a directory scan.
+        """
         model_path = self.get_model_path(model)
         
-        # Check if downloading
-        if model.id in self._download_threads:
-            thread = self._download_threads[model.id]
-            if thread.is_alive():
-                return ModelStatus.DOWNLOADING
+        # Check if downloading (a run stays registered until its thread's cleanup)
+        if model.id in self._downloads:
+            return ModelStatus.DOWNLOADING
+        
+        try:
+            mtime = os.path.getmtime(model_path)
+        except OSError:
+            mtime = 0.0  # Folder does not exist
+        
+        cached = self._status_cache.get(model.id)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        status = self._check_downloaded(model, model_path)
+        self._status_cache[model.id] = (mtime, status)
+        return status
+    
+    def prime_status_cache(self, models: List[ModelInfo]) -> None:
+        """
+        Fill the status cache for many models from one models-folder scan.
+        
+        One scandir of models_dir yields every model folder's mtime (free
+        on Windows, where it comes with the directory listing), so only
+        folders that changed since the last check are inspected.
+        """
+        try:
+            with os.scandir(self.models_dir) as entries:
+                folders = {entry.name: entry for entry in entries}
+        except OSError:
+            folders = {}
         
-        # Check if downloaded
+        for model in models:
+            model_path = self.get_model_path(model)
+            entry = folders.get(model_path.name)
+            try:
+                mtime = entry.stat().st_mtime if entry is not None else 0.0
+            except OSError:
+                mtime = 0.0
+            cached = self._status_cache.get(model.id)
+            if cached is None or cached[0] != mtime:
+                self._status_cache[model.id] = (mtime, self._check_downloaded(model, model_path))
+    
+    def record_status(self, model: ModelInfo, status: ModelStatus) -> None:
+        """
+        Cache a status that is already known (e.g. pushed at the end of a
+        download) against the folder's current mtime, without inspecting it.
+        """
+        try:
+            mtime = os.path.getmtime(self.get_model_path(model))
+        except OSError:
+            mtime = 0.0
+        self._status_cache[model.id] = (mtime, status)
+    
+    @staticmethod
+    def _check_downloaded(model: ModelInfo, model_path: Path) -> ModelStatus:
+        """Inspect the model folder for downloaded files."""
         if model_path.exists():
             # For Hugging Face models, check for model files
             if model.hf_repo:
@@ -178,57 +273,142 @@ class ModelManager:
         self,
         model: ModelInfo,
         progress_callback: Optional[Callable[[str, float, str], None]] = None,
+        on_complete: Optional[Callable[[str, bool], None]] = None,
     ) -> None:
         """
         Start downloading a model in background.
         
+        If the model is already downloading, the callbacks are attached to
+        the running download instead. A download that was cancelled but is
+        still finishing its current file is restarted: the new run waits for
+        the old thread to exit, then starts over.
+        
         Args:
             model: Model to download
             progress_callback: Callback(model_id, progress, status_text)
+            on_complete: Callback(model_id, success) once the download thread
+                is done, so callers know the final status without re-checking
+                the filesystem
+        """
+        with self._downloads_lock:
+            if self._add_listeners_locked(model, progress_callback, on_complete):
+                return
+            previous = self._downloads.get(model.id)
+            job = _DownloadJob()
+            if progress_callback:
+                job.progress_listeners.append(progress_callback)
+            if on_complete:
+                job.complete_listeners.append(on_complete)
+            job.thread = threading.Thread(
+                target=self._download_model,
+                args=(model, job, previous.thread if previous else None),
+                daemon=True,
+            )
+            self._downloads[model.id] = job
+            self._download_progress[model.id] = 0.0
+        job.thread.start()
+    
+    def add_listeners(
+        self,
+        model: ModelInfo,
+        progress_callback: Optional[Callable[[str, float, str], None]] = None,
+        on_complete: Optional[Callable[[str, bool], None]] = None,
+    ) -> bool:
+        """
+        Attach callbacks to a running (not cancelled) download of a model.
+        
+        Returns:
+            True if attached; False if the model is not downloading, in which
+            case the callbacks will never be called
+        """
+        with self._downloads_lock:
+            return self._add_listeners_locked(model, progress_callback, on_complete)
+    
+    def _add_listeners_locked(self, model, progress_callback, on_complete) -> bool:
+        """add_listeners(); the caller holds _downloads_lock."""
+        job = self._downloads.get(model.id)
+        if job is None or job.cancel.is_set():
+            return False
+        with job.lock:
+            if progress_callback:
+                job.progress_listeners.append(progress_callback)
+            if on_complete:
+                job.complete_listeners.append(on_complete)
+        return True
+    
+    def cancel(self, model: ModelInfo) -> Optional[threading.Thread]:
         """
-        if self.get_status(model) == ModelStatus.DOWNLOADING:
-            return
+        Ask a running download to stop.
         
-        if progress_callback:
-            self._download_callbacks[model.id] = progress_callback
+        The download thread checks between files / network blocks and
+        stops at the next check; partial files are left for the caller.
+        URL downloads check every network block and stop promptly. Hugging
+        Face downloads can only check between files: hf_hub_download offers
+        no per-block hook, so the file in flight (up to a few GB for the
+        large Whisper weights) is finished before the thread exits.
         
-        thread = threading.Thread(
-            target=self._download_model,
-            args=(model,),
-            daemon=True,
-        )
-        self._download_threads[model.id] = thread
-        self._download_progress[model.id] = 0.0
-        thread.start()
+        Returns:
+            The download thread (join it to wait until it has stopped),
+            or None if the model is not downloading
+        """
+        with self._downloads_lock:
+            job = self._downloads.get(model.id)
+        if job is None:
+            return None
+        job.cancel.set()
+        return job.thread
     
-    def _download_model(self, model: ModelInfo) -> None:
+    def _download_model(
+        self,
+        model: ModelInfo,
+        job: _DownloadJob,
+        previous: Optional[threading.Thread],
+    ) -> None:
         """Download a model (runs in background thread)."""
+        callback = job.report
+        success = False
         try:
-            callback = self._download_callbacks.get(model.id)
-            
-            if model.hf_repo:
-                self._download_from_huggingface(model, callback)
-            elif model.download_url:
-                self._download_from_url(model, callback)
+            # A cancelled earlier run may still be writing the same files
+            if previous is not None:
+                previous.join()
+            # Wait for a free slot: parallel transfers only compete for bandwidth
+            with self._download_slots:
+                job.check_cancelled(model.id)
+                self._download_model_files(model, job)
             
             self._download_progress[model.id] = 1.0
-            if callback:
-                callback(model.id, 1.0, t("download_status_complete"))
+            success = True
+            callback(model.id, 1.0, t("download_status_complete"))
+        except DownloadCancelled:
+            from ..logger import info as log_info
+            log_info(f"Download cancelled: {model.id}")
         except Exception as e:
             from ..logger import error as log_error
             log_error(f"Download error: {e}")
-            if callback:
-                callback(model.id, -1, t("download_status_error").format(error=str(e)))
+            callback(model.id, -1, t("download_status_error").format(error=str(e)))
         finally:
-            if model.id in self._download_threads:
-                del self._download_threads[model.id]
+            self._status_cache.pop(model.id, None)
+            with self._downloads_lock:
+                # A restarted run has already replaced this one
+                if self._downloads.get(model.id) is job:
+                    del self._downloads[model.id]
+            with job.lock:
+                complete_listeners = list(job.complete_listeners)
+                job.progress_listeners.clear()
+                job.complete_listeners.clear()
+            for on_complete in complete_listeners:
+                on_complete(model.id, success)
     
-    def _download_from_huggingface(
-        self,
-        model: ModelInfo,
-        callback: Optional[Callable[[str, float, str], None]],
-    ) -> None:
+    def _download_model_files(self, model: ModelInfo, job: _DownloadJob) -> None:
+        """Fetch a model from its source."""
+        if model.hf_repo:
+            self._download_from_huggingface(model, job)
+        elif model.download_url:
+            self._download_from_url(model, job)
+    
+    def _download_from_huggingface(self, model: ModelInfo, job: _DownloadJob) -> None:
         """Download model from Hugging Face Hub."""
+        callback = job.report
         try:
             from huggingface_hub import HfApi, hf_hub_download
         except ImportError:
@@ -269,6 +449,8 @@ class ModelManager:
         last_reported = {"percent": -5}
 
         for f in files:
+            # Cancel is only seen between files; see cancel()
+            job.check_cancelled(model.id)
             hf_hub_download(
                 repo_id=model.hf_repo,
                 filename=f.rfilename,
@@ -298,12 +480,9 @@ class ModelManager:
             callback(model.id, 0.98, t("download_status_verifying"))
         print(f"[ModelManager] {t(model.name)}: 98% ({t('download_status_verifying')})")
     
-    def _download_from_url(
-        self,
-        model: ModelInfo,
-        callback: Optional[Callable[[str, float, str], None]],
-    ) -> None:
+    def _download_from_url(self, model: ModelInfo, job: _DownloadJob) -> None:
         """Download model from direct URL."""
+        callback = job.report
         import urllib.request
         import tempfile
         import zipfile
@@ -321,6 +500,7 @@ class ModelManager:
             tmp_path = tmp.name
             
             def report_progress(block_num, block_size, total_size):
+                job.check_cancelled(model.id)
                 if total_size > 0:
                     progress = min(0.8, block_num * block_size / total_size * 0.8)
                     self._download_progress[model.id] = progress
@@ -333,7 +513,12 @@ class ModelManager:
                         last_reported["percent"] = percent
                         print(f"[ModelManager] {t(model.name)}: {percent}%")
             
+        try:
             urllib.request.urlretrieve(url, tmp_path, report_progress)
+            job.check_cancelled(model.id)
+        except DownloadCancelled:
+            os.unlink(tmp_path)
+            raise
         
         if callback:
             callback(model.id, 0.85, t("download_status_extracting"))
@@ -368,9 +553,8 @@ class ModelManager:
     
     def delete(self, model: ModelInfo) -> bool:
         """Delete a downloaded model."""
-        import shutil
-        
         model_path = self.get_model_path(model)
+        self._status_cache.pop(model.id, None)
         if model_path.exists():
             try:
                 shutil.rmtree(model_path)
@@ -386,3 +570,20 @@ class ModelManager:
     def get_models_by_type(self, model_type: ModelType) -> List[ModelInfo]:
         """Get models of a specific type."""
         return [m for m in SUPPORTED_MODELS if m.model_type == model_type]
+
+
+# Global instance
+_instance: Optional[ModelManager] = None
+
+
+def get_model_manager() -> ModelManager:
+    """
+    Get the global model manager instance.
+    
+    Sharing one instance means the status cache and the state of running
+    downloads are the same for every window that asks.
+    """
+    global _instance
+    if _instance is None:
+        _instance = ModelManager()
+    return _instance
@@ -5,16 +5,19 @@ Combines audio capture, VAD, buffering, and transcription into
 a seamless real-time subtitle generation system.
 """
 
-import threading
+import itertools
 import queue
+import signal
+import threading
 import time
-from typing import Optional, Callable
+from collections import OrderedDict
+from typing import Optional, Callable, Tuple
 from dataclasses import dataclass
 import numpy as np
 
 from .audio.capture import AudioCapture
-from .audio.buffer import StreamingAudioBuffer, SimpleAudioBuffer
-from .transcription.whisper_transcriber import WhisperTranscriber, TranscriptionResult
+from .audio.buffer import StreamingAudioBuffer, SimpleAudioBuffer, SegmentRing
+from .transcription.whisper_transcriber import WhisperTranscriber, TranscriptionResult, TimedWord
 from .logger import info, debug, warning, error
 
 # Translation support (optional)
@@ -26,9 +29,9 @@ except ImportError:
     create_translator = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleEvent:
-    """A subtitle event with text and metadata."""
+    """A subtitle event with text and metadata (slotted: no per-instance __dict__)."""
     text: str
     language: str
     confidence: float
@@ -39,6 +42,9 @@ class SubtitleEvent:
     # Dual-buffer support
     committed_translation: Optional[str] = None  # 已鎖定翻譯
     draft_translation: Optional[str] = None  # 浮動區翻譯
+    # Set by RealtimePipeline: a translation arrives as a second event with
+    # the same segment_id (0 = not tracked)
+    segment_id: int = 0
 
 
 class RealtimePipeline:
@@ -63,6 +69,15 @@ class RealtimePipeline:
         >>> pipeline.start()
     """
     
+    MAX_BATCH_SIZE = 8  # Most queued segments transcribed in one model call
+    MAX_QUEUED_SEGMENTS = 4  # Older segments are dropped beyond this
+    BATCH_WINDOW_SECONDS = 0.015  # How long to wait for more segments to batch with
+    LA_FLUSH_SECONDS = 1.5  # Commit the pending hypothesis after this long without audio
+    LA_PROMPT_CHARS = 200  # Committed text carried into the next round's prompt
+    MIN_SEGMENT_SECONDS = 0.3  # Shorter segments are not worth a Whisper call
+    MIN_SEGMENT_RMS = 1e-3  # Below this the segment is treated as silence (~-60 dBFS)
+    MAX_SEGMENT_ZCR = 0.45  # Zero-crossing rate above this is broadband noise, not speech
+    
     def __init__(
         self,
         model: str = "base",
@@ -72,10 +87,15 @@ class RealtimePipeline:
         vad_silence_ms: int = 100,
         min_segment_duration: float = 1.0,
         max_segment_duration: float = 5.0,
+        hard_max_buffer_s: float = 30.0,
+        local_agreement: bool = False,
         # Translation settings
         enable_translation: bool = False,
         translation_engine: str = "google",
         target_language: str = "zh",
+        translation_cache_size: int = 512,
+        # Whisper settings
+        compute_type: str = "auto",
     ):
         """
         Initialize the pipeline.
@@ -88,34 +108,51 @@ class RealtimePipeline:
             vad_silence_ms: Silence duration to end speech (milliseconds)
             min_segment_duration: Minimum speech duration before transcribing
             max_segment_duration: Maximum speech duration before forcing transcription
+            hard_max_buffer_s: Absolute cap on buffered audio; older audio is
+                              force-committed past this (Whisper's 30s window)
+            local_agreement: Re-transcribe a rolling window and only commit words
+                            that two consecutive rounds agree on (LocalAgreement-2);
+                            the unconfirmed tail is emitted as a partial event
             enable_translation: Whether to enable translation
             translation_engine: "google" or "nllb"
             target_language: Target language for translation
+            translation_cache_size: Recent translations kept in an LRU cache
+                                   (repeated phrases skip the translator); 0 disables
+            compute_type: Whisper weight/compute precision; "auto" picks int8
+                         on CPU and int8_float16 on CUDA
         """
         self.on_subtitle = on_subtitle or self._default_callback
         self.use_vad = use_vad
         self.enable_translation = enable_translation
         self.translation_engine = translation_engine
         self.target_language = target_language
+        self.local_agreement = local_agreement
+        self._hard_max_samples = int(hard_max_buffer_s * 16000)
+        
+        # LocalAgreement state (transcription thread only)
+        self._la_audio = np.empty(0, dtype=np.float32)  # Audio not yet committed
+        self._la_hypothesis: list = []  # Unconfirmed words from the previous round
+        self._la_last_audio = 0.0  # time.time() of the last appended segment
+        self._la_language = language or ""
+        self._la_prompt = ""  # Tail of the committed text, used as decoder prompt
         
         # Components
         self._audio_capture = AudioCapture()
         self._transcriber = WhisperTranscriber(
             model_size=model,
+            compute_type=compute_type,
             language=language,
+            # Silero already cut the segments; the built-in VAD is only needed
+            # for the fixed-length chunks of SimpleAudioBuffer
+            vad_filter=not use_vad,
         )
         
-        # Translation (optional)
+        # Translation (optional, created by the warmup thread)
         self._translator = None
-        if enable_translation and TRANSLATION_AVAILABLE:
-            try:
-                self._translator = create_translator(
-                    engine=translation_engine,
-                    target_language=target_language,
-                )
-            except Exception as e:
-                warning(f"Pipeline: Translation init failed: {e}")
-                self._translator = None
+        
+        # LRU of recent translations: (source, target, normalized text) -> translation
+        self._translation_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._translation_cache_size = translation_cache_size
         
         # Buffer - choose based on VAD setting
         if use_vad:
@@ -125,6 +162,7 @@ class RealtimePipeline:
                 max_segment_duration=max_segment_duration,
                 speech_pad_ms=vad_silence_ms,  # Use VAD silence setting
                 use_vad=True,
+                hard_max_buffer_s=hard_max_buffer_s,
             )
         else:
             self._buffer = SimpleAudioBuffer(
@@ -134,19 +172,92 @@ class RealtimePipeline:
         
         # State
         self._running = False
-        # Use a limited queue to prevent unbounded latency
-        # If transcription can't keep up, old segments will be dropped
-        self._transcription_queue: queue.Queue = queue.Queue(maxsize=3)
+        # Small preallocated ring to prevent unbounded latency: if transcription
+        # can't keep up, the oldest segments are dropped (newest wins). Slots fit
+        # the longest segment the buffer can emit (max duration + padding + one
+        # capture chunk).
+        slot_seconds = min(max(min_segment_duration, max_segment_duration), hard_max_buffer_s) + 1.0
+        self._transcription_ring = SegmentRing(
+            capacity=self.MAX_QUEUED_SEGMENTS,
+            max_samples=int(slot_seconds * 16000),
+        )
         self._transcription_thread: Optional[threading.Thread] = None
-        self._dropped_segments = 0  # Track how many segments were dropped
+        # Translation runs on its own thread so slow (network) engines never
+        # hold up transcription; items are (segment_id, text, language)
+        self._translation_queue: queue.Queue = queue.Queue()
+        self._translation_thread: Optional[threading.Thread] = None
+        self._segment_ids = itertools.count(1)
         
         # Display state (like realtime mode)
         self.max_lines = 3  # Maximum lines to display
         self._lines: list = []  # History of lines
         self._translation_lines: list = []  # History of translation lines
         
-        trans_status = "enabled" if self._translator else "disabled"
-        info(f"Pipeline: Initialized model={model}, language={language or 'auto'}, VAD={use_vad}, translation={trans_status}")
+        # The translation state is logged once the warmup thread has built (or failed to build) it
+        info(f"Pipeline: Initialized model={model}, language={language or 'auto'}, VAD={use_vad}")
+        
+        # Load models in the background so construction returns immediately;
+        # start() waits for this to finish
+        self._ready = threading.Event()
+        # Set by stop(); a stop during loading leaves the model release to
+        # the warmup thread and makes a pending start() bail out
+        self._stopped = threading.Event()
+        self._lifecycle_lock = threading.Lock()  # Orders start() against stop()
+        # Held while loading or releasing models, so the two never overlap
+        self._release_lock = threading.Lock()
+        self._models_released = False  # Set (under _lifecycle_lock) before a release; start() reloads
+        self._warmup_error: Optional[Exception] = None
+        self._start_warmup()
+    
+    def _start_warmup(self) -> None:
+        """Load the models on a background thread; _ready is set when done."""
+        self._ready.clear()
+        self._warmup_error = None
+        self._warmup_thread = threading.Thread(target=self._warmup, daemon=True)
+        self._warmup_thread.start()
+    
+    def _warmup(self) -> None:
+        """Load and warm up the models (runs on the warmup thread)."""
+        try:
+            with self._release_lock:
+                self._load_models()
+        finally:
+            with self._lifecycle_lock:
+                self._ready.set()
+                # stop() was called while loading and did not wait for us
+                release = self._stopped.is_set()
+                if release:
+                    self._models_released = True
+            if release:
+                self._release_models()
+    
+    def _load_models(self) -> None:
+        """Load Whisper and the translator; errors are kept for start()."""
+        try:
+            info("Pipeline: Pre-loading models...")
+            
+            # Load Whisper and run one dummy inference, so the first real
+            # utterance does not pay for kernel selection / CUDA init
+            self._transcriber.warmup()
+            
+            if self.enable_translation and TRANSLATION_AVAILABLE:
+                try:
+                    self._translator = create_translator(
+                        engine=self.translation_engine,
+                        target_language=self.target_language,
+                    )
+                    # Warm up translator with a test translation
+                    self._translator.translate("test")
+                    info("Pipeline: Translation model ready")
+                except Exception as e:
+                    warning(f"Pipeline: Translation init failed: {e}")
+                    self._translator = None
+            
+            trans_status = "enabled" if self._translator is not None else "disabled"
+            info(f"Pipeline: All models loaded, translation={trans_status}")
+        except Exception as e:
+            error(f"Pipeline: Model loading failed: {e}")
+            self._warmup_error = e
     
     def _split_into_lines(self, text: str, max_chars_per_line: int = 55) -> list:
         """
@@ -203,121 +314,329 @@ class RealtimePipeline:
     
     def _on_audio(self, audio: np.ndarray, sample_rate: int) -> None:
         """Callback from AudioCapture - feeds into buffer."""
+        # Capture contract: read-only float32 mono (AudioCapture reads the
+        # stream as float32), so no conversion or check on the audio thread
         self._buffer.add_audio(audio)
     
     def _on_audio_segment(self, audio: np.ndarray) -> None:
         """Callback from Buffer - queues for transcription."""
         debug(f"Pipeline: Audio segment received ({len(audio)/16000:.1f}s)")
-        try:
-            # Try to add to queue, but don't block if full
-            self._transcription_queue.put_nowait(audio)
-        except queue.Full:
-            # Queue is full - drop the oldest segment and add new one
+        # Never blocks: a full ring drops its oldest segment
+        if not self._transcription_ring.try_push(audio):
+            dropped = self._transcription_ring.dropped
+            if dropped % 5 == 1:  # Log every 5 drops
+                warning(f"Pipeline: Dropped {dropped} stale segments (transcription can't keep up)")
+    
+    def get_stats(self) -> dict:
+        """
+        Get overload statistics.
+        
+        Returns:
+            Dict with dropped_segments (evicted before transcription),
+            queued_segments, forced_trims (hard buffer cap hits) and
+            translation_cache_entries
+        """
+        return {
+            "dropped_segments": self._transcription_ring.dropped,
+            "queued_segments": len(self._transcription_ring),
+            "forced_trims": self._buffer.forced_trims,
+            "translation_cache_entries": len(self._translation_cache),
+        }
+    
+    def _cached_translate(self, text: str, source_language: str) -> str:
+        """Translate text, reusing results for recently seen phrases."""
+        if self._translation_cache_size <= 0:
+            return self._translator.translate(text)
+        
+        key = (source_language, self.target_language, text.strip().lower())
+        cache = self._translation_cache
+        translated = cache.get(key)
+        if translated is not None:
+            cache.move_to_end(key)
+            return translated
+        
+        translated = self._translator.translate(text)
+        if translated:  # Translators return "" on error - don't cache failures
+            cache[key] = translated
+            if len(cache) > self._translation_cache_size:
+                cache.popitem(last=False)
+        return translated
+    
+    def _display_lines(self, text: str) -> str:
+        """Split text into lines and keep only the last max_lines."""
+        lines = self._split_into_lines(text, max_chars_per_line=45)
+        return "\n".join(lines[-self.max_lines:])
+    
+    def _emit_result(self, result: TranscriptionResult, is_partial: bool = False) -> None:
+        """Deliver one transcription result and queue its translation (if enabled)."""
+        if not result.text.strip():
+            return
+        text = result.text.strip()
+        
+        # The original text goes out immediately; the translation follows as
+        # an update with the same segment_id (partials are revised soon, so
+        # only final text is translated)
+        segment_id = next(self._segment_ids)
+        event = SubtitleEvent(
+            text=self._display_lines(text),
+            language=result.language,
+            confidence=result.confidence,
+            timestamp=time.time(),
+            is_partial=is_partial,
+            segment_id=segment_id,
+        )
+        self.on_subtitle(event)
+        
+        if self._translator and not is_partial:
+            self._translation_queue.put((segment_id, text, result.language))
+    
+    def _translation_loop(self) -> None:
+        """Background thread for translation."""
+        while self._running:
             try:
-                self._transcription_queue.get_nowait()  # Remove oldest
-                self._transcription_queue.put_nowait(audio)  # Add newest
-                self._dropped_segments += 1
-                if self._dropped_segments % 5 == 1:  # Log every 5 drops
-                    warning(f"Pipeline: Dropped {self._dropped_segments} segments (transcription can't keep up)")
+                segment_id, text, language = self._translation_queue.get(timeout=0.1)
             except queue.Empty:
-                pass
+                continue
+            
+            if self._translator is None:
+                continue
+            
+            try:
+                translated = self._cached_translate(text, language)
+            except Exception as e:
+                warning(f"Pipeline: Translation error: {e}")
+                continue
+            if not translated:
+                continue
+            debug(f"Pipeline: Translated: {text[:30]}... -> {translated[:30]}...")
+            
+            event = SubtitleEvent(
+                text=self._display_lines(text),
+                language=language,
+                confidence=0.0,
+                timestamp=time.time(),
+                translated_text=self._display_lines(translated),
+                target_language=self.target_language,
+                segment_id=segment_id,
+            )
+            self.on_subtitle(event)
+    
+    @staticmethod
+    def _normalize_word(word: TimedWord) -> str:
+        """Comparison key for agreement between rounds."""
+        return word.text.strip().lower()
+    
+    def _commit_words(self, words: list, language: str, confidence: float) -> None:
+        """Emit words as final text and drop their audio from the rolling window."""
+        if not words:
+            return
+        cut = min(len(self._la_audio), int(words[-1].end * 16000))
+        self._la_audio = self._la_audio[cut:]
+        # Same filter as the batch path; a hallucination must not become the prompt either
+        text = self._transcriber.filter_hallucinations("".join(word.text for word in words).strip())
+        if not text:
+            return
+        self._la_prompt = (self._la_prompt + " " + text)[-self.LA_PROMPT_CHARS:].lstrip()
+        self._emit_result(TranscriptionResult(text, language, confidence, 0.0))
+    
+    def _local_agreement_round(self, batch: list) -> None:
+        """
+        One LocalAgreement-2 round over the rolling window.
+        
+        The window (everything not yet committed plus the new segments) is
+        re-transcribed; the longest word prefix matching the previous round's
+        hypothesis is committed and its audio dropped, the rest is shown as a
+        partial and becomes the next hypothesis.
+        """
+        self._la_audio = np.concatenate([self._la_audio] + batch)
+        self._la_last_audio = time.time()
+        
+        # The committed text is already decoded: pass it as the prompt so the
+        # decoder continues from it instead of re-deriving the context
+        result = self._transcriber.transcribe_words(self._la_audio, prompt=self._la_prompt)
+        words = result.words or []
+        
+        # Longest common prefix with the previous round
+        agreed = 0
+        for previous, current in zip(self._la_hypothesis, words):
+            if self._normalize_word(previous) != self._normalize_word(current):
+                break
+            agreed += 1
+        
+        # Never hold more than the hard cap: commit everything instead
+        if len(self._la_audio) > self._hard_max_samples:
+            agreed = len(words)
+        
+        self._commit_words(words[:agreed], result.language, result.confidence)
+        self._la_hypothesis = words[agreed:]
+        self._la_language = result.language
+        if not words:
+            # Nothing recognized: keep only the last second in case a word is starting
+            self._la_audio = self._la_audio[-16000:]
+        
+        partial = self._transcriber.filter_hallucinations(
+            "".join(word.text for word in self._la_hypothesis).strip()
+        )
+        if partial:
+            self._emit_result(
+                TranscriptionResult(partial, result.language, result.confidence, result.duration),
+                is_partial=True,
+            )
+    
+    def _local_agreement_flush(self) -> None:
+        """Commit the pending hypothesis once the audio has gone quiet."""
+        if not self._la_hypothesis:
+            return
+        if time.time() - self._la_last_audio < self.LA_FLUSH_SECONDS:
+            return
+        text = self._transcriber.filter_hallucinations(
+            "".join(word.text for word in self._la_hypothesis).strip()
+        )
+        self._la_hypothesis = []
+        self._la_audio = np.empty(0, dtype=np.float32)
+        self._la_prompt = ""  # Pause ends the utterance; start the next one fresh
+        if text:
+            self._emit_result(TranscriptionResult(text, self._la_language, 0.0, 0.0))
+    
+    def _should_transcribe(self, audio: np.ndarray) -> bool:
+        """
+        Cheap gate in front of Whisper.
+        
+        Segments already passed VAD, but short noise bursts still leak through
+        and Whisper tends to hallucinate on them. Rejects segments that are too
+        short, too quiet (RMS) or noise-like (zero-crossing rate).
+        """
+        n = len(audio)
+        if n < self.MIN_SEGMENT_SECONDS * 16000:
+            return False
+        
+        # Sum of squares via dot product (no squared temporary)
+        rms = np.sqrt(float(np.dot(audio, audio)) / n)
+        if rms < self.MIN_SEGMENT_RMS:
+            debug(f"Pipeline: Skipping silent segment (rms={rms:.5f})")
+            return False
+        
+        signs = np.signbit(audio)
+        zcr = np.count_nonzero(signs[1:] != signs[:-1]) / (n - 1)
+        if zcr > self.MAX_SEGMENT_ZCR:
+            debug(f"Pipeline: Skipping noise-like segment (zcr={zcr:.2f})")
+            return False
+        
+        return True
     
     def _transcription_loop(self) -> None:
         """Background thread for transcription."""
+        ring = self._transcription_ring
         while self._running:
-            try:
-                audio = self._transcription_queue.get(timeout=0.1)
-            except queue.Empty:
+            audio = ring.try_pop()
+            if audio is None:
+                ring.wait(timeout=0.1)
+                if self.local_agreement:
+                    self._local_agreement_flush()
                 continue
             
-            # Check if we're falling behind and skip if too many queued
-            queue_size = self._transcription_queue.qsize()
-            if queue_size >= 2:
-                warning(f"Pipeline: Queue backup ({queue_size} segments), skipping older audio")
-                continue  # Skip this segment to catch up
+            # Drain whatever else is pending so a backlog is transcribed in
+            # one batched model call instead of being skipped. Segments that
+            # arrive within a short window are grouped as well: the window is
+            # tiny next to the model call, which costs nearly the same for a
+            # batch as for a single segment.
+            batch = [audio]
+            deadline = time.monotonic() + self.BATCH_WINDOW_SECONDS
+            while len(batch) < self.MAX_BATCH_SIZE:
+                pending = ring.try_pop()
+                if pending is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    ring.wait(timeout=remaining)
+                    continue
+                batch.append(pending)
             
-            # Skip if too short
-            duration = len(audio) / 16000
-            if duration < 0.3:
+            # Skip segments that are too short, silent or noise
+            batch = [segment for segment in batch if self._should_transcribe(segment)]
+            if not batch:
                 continue
             
-            # Transcribe
+            if len(batch) > 1:
+                debug(f"Pipeline: Transcribing {len(batch)} queued segments as one batch")
+            
+            # Transcribe (results come back in submission order)
             try:
-                result = self._transcriber.transcribe(audio)
-                
-                if result.text.strip():
-                    text = result.text.strip()
-                    
-                    # Split text into lines, keep only last max_lines
-                    lines = self._split_into_lines(text, max_chars_per_line=45)
-                    display_lines = lines[-self.max_lines:]  # Only show last 5 lines
-                    display_text = "\n".join(display_lines)
-                    
-                    # Translate if enabled
-                    translated_display = None
-                    if self._translator:
-                        try:
-                            translated = self._translator.translate(text)
-                            if translated:
-                                # Split translation into lines too, keep only last max_lines
-                                trans_lines = self._split_into_lines(translated, max_chars_per_line=45)
-                                trans_display_lines = trans_lines[-self.max_lines:]
-                                translated_display = "\n".join(trans_display_lines)
-                                debug(f"Pipeline: Translated: {text[:30]}... -> {translated[:30]}...")
-                        except Exception as e:
-                            warning(f"Pipeline: Translation error: {e}")
-                    
-                    event = SubtitleEvent(
-                        text=display_text,
-                        language=result.language,
-                        confidence=result.confidence,
-                        timestamp=time.time(),
-                        translated_text=translated_display,
-                        target_language=self.target_language if translated_display else None,
-                    )
-                    self.on_subtitle(event)
+                if self.local_agreement:
+                    self._local_agreement_round(batch)
+                    continue
+                results = self._transcriber.transcribe_batch(batch)
+                for result in results:
+                    self._emit_result(result)
             except Exception as e:
                 error(f"Pipeline: Transcription error: {e}")
     
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the models are loaded; returns False on timeout."""
+        return self._ready.wait(timeout)
+    
     def start(self) -> None:
         """Start the real-time pipeline."""
         if self._running:
             return
         
-        # Pre-load models BEFORE starting audio capture to avoid queue buildup
-        info("Pipeline: Pre-loading models...")
-        
-        # Load Whisper model (this triggers lazy loading)
-        self._transcriber._ensure_model_loaded()
-        
-        # Pre-load translation model if enabled
-        if self._translator:
-            try:
-                # Warm up translator with a test translation
-                self._translator.translate("test")
-                info("Pipeline: Translation model ready")
-            except Exception as e:
-                warning(f"Pipeline: Translation warmup failed: {e}")
-        
-        info("Pipeline: All models loaded, starting audio capture...")
+        with self._lifecycle_lock:
+            # Only a stop() from here on cancels this start
+            self._stopped.clear()
+            if self._models_released:
+                # Restart after stop(): the models were released, load them again
+                self._models_released = False
+                self._start_warmup()
         
-        self._running = True
+        # Models must be loaded BEFORE starting audio capture to avoid queue buildup
+        self._ready.wait()
+        if self._warmup_error is not None:
+            raise self._warmup_error
         
-        # Start transcription thread
-        self._transcription_thread = threading.Thread(
-            target=self._transcription_loop,
-            daemon=True,
-        )
-        self._transcription_thread.start()
-        
-        # Start audio capture AFTER models are loaded
-        self._audio_capture.start(callback=self._on_audio)
+        with self._lifecycle_lock:
+            if self._stopped.is_set():
+                info("Pipeline: Stopped during model loading, not starting")
+                return
+            
+            info("Pipeline: Starting audio capture...")
+            
+            self._running = True
+            
+            # Start transcription thread
+            self._transcription_thread = threading.Thread(
+                target=self._transcription_loop,
+                daemon=True,
+            )
+            self._transcription_thread.start()
+            
+            # Start translation thread
+            if self._translator:
+                self._translation_thread = threading.Thread(
+                    target=self._translation_loop,
+                    daemon=True,
+                )
+                self._translation_thread.start()
+            
+            # Start audio capture AFTER models are loaded
+            self._audio_capture.start(callback=self._on_audio)
         
         info("Pipeline: Started")
     
     def stop(self) -> None:
-        """Stop the pipeline and release resources."""
-        self._running = False
+        """
+        Stop the pipeline and release resources.
+        
+        Never blocks on model loading: when called before the models are
+        ready, the warmup thread releases them once loading finishes and a
+        pending start() returns without starting capture.
+        """
+        with self._lifecycle_lock:
+            self._running = False
+            self._stopped.set()
+            if not self._ready.is_set():
+                info("Pipeline: Stop requested during model loading")
+                return
+            self._models_released = True  # Released below; a later start() reloads
         
         self._audio_capture.stop()
         self._buffer.reset()
@@ -325,39 +644,22 @@ class RealtimePipeline:
         if self._transcription_thread:
             self._transcription_thread.join(timeout=2.0)
         
-        # Clear queue
-        while not self._transcription_queue.empty():
+        if self._translation_thread:
+            self._translation_thread.join(timeout=2.0)
+            self._translation_thread = None
+        
+        # Clear queues
+        self._transcription_ring.clear()
+        while not self._translation_queue.empty():
             try:
-                self._transcription_queue.get_nowait()
+                self._translation_queue.get_nowait()
             except queue.Empty:
                 break
+        self._la_audio = np.empty(0, dtype=np.float32)
+        self._la_hypothesis = []
+        self._la_prompt = ""
         
-        # Release Whisper model to free CUDA memory
-        if hasattr(self, '_transcriber') and self._transcriber:
-            if hasattr(self._transcriber, '_model') and self._transcriber._model is not None:
-                del self._transcriber._model
-                self._transcriber._model = None
-                info("Pipeline: Released Whisper model")
-        
-        # Release translator model
-        if hasattr(self, '_translator') and self._translator:
-            if hasattr(self._translator, 'model'):
-                del self._translator.model
-            if hasattr(self._translator, 'tokenizer'):
-                del self._translator.tokenizer
-            self._translator = None
-            info("Pipeline: Released translator model")
-        
-        # Clear CUDA cache
-        try:
-            import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-                info("Pipeline: Cleared CUDA cache")
-        except ImportError:
-            pass
-        except Exception as e:
-            warning(f"Pipeline: Failed to clear CUDA cache: {e}")
+        self._release_models()
         
         # Clear display history
         self._lines = []
@@ -365,6 +667,38 @@ class RealtimePipeline:
         
         info("Pipeline: Stopped")
     
+    def _release_models(self) -> None:
+        """Release the Whisper and translation models and the CUDA cache."""
+        with self._release_lock:
+            # Release Whisper model to free CUDA memory
+            if hasattr(self, '_transcriber') and self._transcriber:
+                if hasattr(self._transcriber, '_model') and self._transcriber._model is not None:
+                    del self._transcriber._model
+                    self._transcriber._model = None
+                    self._transcriber._batched_model = None
+                    info("Pipeline: Released Whisper model")
+            
+            # Release translator model
+            if hasattr(self, '_translator') and self._translator:
+                if hasattr(self._translator, 'model'):
+                    del self._translator.model
+                if hasattr(self._translator, 'tokenizer'):
+                    del self._translator.tokenizer
+                self._translator = None
+                self._translation_cache.clear()
+                info("Pipeline: Released translator model")
+            
+            # Clear CUDA cache
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+                    info("Pipeline: Cleared CUDA cache")
+            except ImportError:
+                pass
+            except Exception as e:
+                warning(f"Pipeline: Failed to clear CUDA cache: {e}")
+    
     def __enter__(self):
         self.start()
         return self
@@ -392,8 +726,11 @@ def run_cli(
     print("\nListening for audio... Press Ctrl+C to stop.\n")
     
     def on_subtitle(event: SubtitleEvent):
-        # Format output
-        print(f"[{event.language}] {event.text}")
+        # Format output (translations arrive as a follow-up event)
+        if event.translated_text:
+            print(f"    -> {event.translated_text}")
+        else:
+            print(f"[{event.language}] {event.text}")
     
     pipeline = RealtimePipeline(
         model=model,
@@ -402,11 +739,21 @@ def run_cli(
         use_vad=use_vad,
     )
     
+    # Ctrl+C just sets an event, so the main thread sleeps instead of polling.
+    # The wait still times out once a second: on Windows an untimed wait
+    # cannot be interrupted by the signal handler.
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    
     try:
-        pipeline.start()
-        while True:
-            time.sleep(0.1)
-    except KeyboardInterrupt:
+        # Models load in the background: wait in timed steps so Ctrl+C during
+        # loading/downloading is noticed instead of blocking in start()
+        while not (pipeline.wait_ready(1.0) or stop_event.is_set()):
+            pass
+        if not stop_event.is_set():
+            pipeline.start()
+            while not stop_event.wait(1.0):
+                pass
         print("\n\nStopping...")
     finally:
         pipeline.stop()
@@ -5,12 +5,20 @@ Saves and loads user settings to a JSON file.
 """
 
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
 from typing import Optional
 
 
 class SettingsManager:
-    """Manages saving and loading user settings."""
+    """
+    Manages saving and loading user settings.
+    
+    Thread-safe: the UI thread writes while pipeline threads read, so all
+    access to the settings dict goes through one re-entrant lock.
+    """
     
     DEFAULT_SETTINGS = {
         "mode": "precise",
@@ -29,8 +37,18 @@ class SettingsManager:
         self._config_dir = Path.home() / ".config" / "realtime-subtitles"
         self._config_file = self._config_dir / "settings.json"
         self._settings = self.DEFAULT_SETTINGS.copy()
+        self._saved_hash: Optional[int] = None  # Hash of the JSON last read/written
+        self._lock = threading.RLock()
+        # Serializes save(): snapshot, compare, write and hash update happen
+        # as one step, so an older snapshot can never replace a newer one
+        self._write_lock = threading.Lock()
         self._load()
     
+    @staticmethod
+    def _serialize(settings: dict) -> str:
+        """Serialize settings exactly as they are written to disk."""
+        return json.dumps(settings, ensure_ascii=False, indent=2)
+    
     def _load(self) -> None:
         """Load settings from file."""
         if self._config_file.exists():
@@ -38,44 +56,82 @@ class SettingsManager:
                 with open(self._config_file, "r", encoding="utf-8") as f:
                     saved = json.load(f)
                 # Merge with defaults (in case new settings were added)
-                self._settings = {**self.DEFAULT_SETTINGS, **saved}
+                settings = {**self.DEFAULT_SETTINGS, **saved}
+                with self._lock:
+                    self._settings = settings
+                    self._saved_hash = hash(self._serialize(settings))
                 from .logger import info
                 info(f"Settings: Loaded from {self._config_file}")
             except Exception as e:
                 from .logger import warning
                 warning(f"Settings: Failed to load: {e}")
-                self._settings = self.DEFAULT_SETTINGS.copy()
+                with self._lock:
+                    self._settings = self.DEFAULT_SETTINGS.copy()
         else:
             from .logger import info
             info("Settings: Using defaults (no saved settings)")
     
     def save(self) -> None:
-        """Save settings to file."""
-        try:
-            self._config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self._config_file, "w", encoding="utf-8") as f:
-                json.dump(self._settings, f, ensure_ascii=False, indent=2)
-            from .logger import debug
-            debug(f"Settings: Saved to {self._config_file}")
-        except Exception as e:
-            from .logger import error
-            error(f"Settings: Failed to save: {e}")
+        """
+        Save settings to file.
+        
+        Skipped when nothing changed since the last load/save. Written to a
+        unique temporary file and swapped in with os.replace, so an
+        interrupted write never leaves a truncated settings.json behind.
+        Concurrent saves run one after another under a dedicated write lock;
+        the settings lock is only held to snapshot the settings, so readers
+        and setters never wait for file I/O.
+        """
+        with self._write_lock:
+            with self._lock:
+                snapshot = dict(self._settings)
+            data = self._serialize(snapshot)
+            data_hash = hash(data)
+            if data_hash == self._saved_hash:
+                return
+            
+            tmp_name = None
+            try:
+                self._config_dir.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=self._config_dir, prefix="settings.", suffix=".json.tmp"
+                )
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(tmp_name, self._config_file)
+                tmp_name = None
+                self._saved_hash = data_hash
+                from .logger import debug
+                debug(f"Settings: Saved to {self._config_file}")
+            except Exception as e:
+                from .logger import error
+                error(f"Settings: Failed to save: {e}")
+            finally:
+                if tmp_name is not None:
+                    try:
+                        os.unlink(tmp_name)
+                    except OSError:
+                        pass
     
     def get(self, key: str, default=None):
         """Get a setting value."""
-        return self._settings.get(key, default)
+        with self._lock:
+            return self._settings.get(key, default)
     
     def set(self, key: str, value) -> None:
         """Set a setting value."""
-        self._settings[key] = value
+        with self._lock:
+            self._settings[key] = value
     
     def update(self, settings: dict) -> None:
         """Update multiple settings at once."""
-        self._settings.update(settings)
+        with self._lock:
+            self._settings.update(settings)
     
     def get_all(self) -> dict:
         """Get all settings."""
-        return self._settings.copy()
+        with self._lock:
+            return self._settings.copy()
 
 
 # Global instance
@@ -1,5 +1,25 @@
 """Speech recognition and transcription modules."""
 
-from .whisper_transcriber import WhisperTranscriber
+import importlib
+
+# Imported on first access (PEP 562): the transcriber pulls in
+# faster-whisper/CTranslate2, which is slow to import and not needed
+# until a pipeline actually starts.
+_LAZY_IMPORTS = {
+    "WhisperTranscriber": ".whisper_transcriber",
+}
 
 __all__ = ["WhisperTranscriber"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,7 @@ Provides real-time speech-to-text using optimized Whisper models.
 """
 
 import time
+from bisect import bisect_right
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
 from pathlib import Path
@@ -19,6 +20,21 @@ except ImportError:
         "faster-whisper is required. Install it with: pip install faster-whisper"
     )
 
+# Batched inference (faster-whisper >= 1.1, optional)
+try:
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_AVAILABLE = True
+except ImportError:
+    BATCHED_AVAILABLE = False
+
+
+@dataclass
+class TimedWord:
+    """A transcribed word with its position in the input audio."""
+    text: str  # Includes Whisper's leading space (if any)
+    start: float  # Seconds from the start of the audio
+    end: float
+
 
 @dataclass
 class TranscriptionResult:
@@ -27,6 +43,7 @@ class TranscriptionResult:
     language: str
     confidence: float
     duration: float  # Processing duration in seconds
+    words: Optional[List[TimedWord]] = None  # Only with word timestamps
     
 
 class WhisperTranscriber:
@@ -95,6 +112,7 @@ class WhisperTranscriber:
         device: str = "auto",
         compute_type: str = "auto",
         language: Optional[str] = None,
+        vad_filter: bool = True,
     ):
         """
         Initialize the Whisper transcriber.
@@ -104,8 +122,12 @@ class WhisperTranscriber:
                        "large-v3-turbo", "distil-large-v3"
                        Smaller = faster but less accurate
             device: "cuda", "cpu", or "auto" (auto-detect)
-            compute_type: "float16", "int8", "float32", or "auto"
+            compute_type: "int8", "int8_float16", "float16", "float32", or "auto"
+                         (auto: int8_float16 on CUDA, int8 on CPU)
             language: Language code (e.g., "en", "zh", "ja") or None for auto-detect
+            vad_filter: Trim silence with faster-whisper's built-in VAD. Turn off
+                       when segments already come from a VAD; applies to single
+                       and batched transcription alike
         """
         # Resolve model alias if needed
         actual_model = self.MODEL_ALIASES.get(model_size, model_size)
@@ -113,7 +135,9 @@ class WhisperTranscriber:
         self.model_size = model_size  # Keep original name for display
         self._actual_model = actual_model  # Use this for loading
         self.language = language
+        self.vad_filter = vad_filter
         self._model: Optional[WhisperModel] = None
+        self._batched_model = None  # BatchedInferencePipeline, created on first batch
         
         # Determine device and compute type
         if device == "auto":
@@ -121,7 +145,9 @@ class WhisperTranscriber:
             device = "cuda" if torch.cuda.is_available() else "cpu"
         
         if compute_type == "auto":
-            compute_type = "float16" if device == "cuda" else "int8"
+            # int8 weights halve model memory and use CTranslate2's int8 kernels;
+            # on CUDA activations stay in float16
+            compute_type = "int8_float16" if device == "cuda" else "int8"
             
         self._device = device
         self._compute_type = compute_type
@@ -154,6 +180,25 @@ class WhisperTranscriber:
                 )
             info(f"WhisperTranscriber: Model loaded in {time.time() - start:.1f}s")
     
+    def warmup(self) -> None:
+        """
+        Load the model and run one dummy inference.
+        
+        The first CTranslate2 call selects kernels and initializes CUDA;
+        doing it here keeps that cost off the first real utterance.
+        """
+        self._ensure_model_loaded()
+        
+        start = time.time()
+        segments, _ = self._model.transcribe(
+            np.zeros(16000, dtype=np.float32),
+            language=self.language,
+            beam_size=1,
+            vad_filter=False,
+        )
+        list(segments)  # Decoding is lazy: consume the generator to run it
+        debug(f"WhisperTranscriber: Warmup inference took {time.time() - start:.2f}s")
+    
     def _get_local_model_path(self) -> Optional[Path]:
         """Get path to local model in project directory if exists."""
         # Map model sizes to local folder names
@@ -210,7 +255,7 @@ class WhisperTranscriber:
             audio,
             language=self.language,
             beam_size=5,
-            vad_filter=True,  # Built-in VAD to skip silence
+            vad_filter=self.vad_filter,  # Built-in VAD to skip silence
             vad_parameters=dict(
                 min_silence_duration_ms=500,
                 speech_pad_ms=200,
@@ -225,7 +270,7 @@ class WhisperTranscriber:
         full_text = " ".join(text_parts)
         
         # Filter out hallucinations
-        full_text = self._filter_hallucinations(full_text)
+        full_text = self.filter_hallucinations(full_text)
         
         duration = time.time() - start_time
         
@@ -236,7 +281,140 @@ class WhisperTranscriber:
             duration=duration,
         )
     
-    def _filter_hallucinations(self, text: str) -> str:
+    def transcribe_words(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = 16000,
+        prompt: Optional[str] = None,
+    ) -> TranscriptionResult:
+        """
+        Transcribe audio with word-level timestamps.
+        
+        Used by incremental (LocalAgreement) streaming, which needs to know
+        where each word ends to drop audio that is already committed.
+        
+        Args:
+            audio: Audio data as float32 numpy array, normalized to [-1, 1]
+            sample_rate: Sample rate in Hz (should be 16000 for Whisper)
+            prompt: Text already committed before this audio, fed to the
+                decoder as its previous-text prompt
+            
+        Returns:
+            TranscriptionResult with words populated
+        """
+        self._ensure_model_loaded()
+        
+        if sample_rate != 16000:
+            raise ValueError("Audio must be 16kHz for Whisper")
+        
+        if audio.dtype != np.float32:
+            audio = audio.astype(np.float32)
+        
+        start_time = time.time()
+        
+        segments, info = self._model.transcribe(
+            audio,
+            language=self.language,
+            beam_size=5,
+            word_timestamps=True,
+            condition_on_previous_text=False,
+            initial_prompt=prompt or None,
+            vad_filter=False,  # Timestamps must stay relative to the input
+        )
+        
+        words = [
+            TimedWord(text=word.word, start=word.start, end=word.end)
+            for segment in segments
+            for word in (segment.words or [])
+        ]
+        
+        return TranscriptionResult(
+            text="".join(word.text for word in words).strip(),
+            language=info.language,
+            confidence=info.language_probability,
+            duration=time.time() - start_time,
+            words=words,
+        )
+    
+    def transcribe_batch(
+        self,
+        audios: List[np.ndarray],
+        sample_rate: int = 16000,
+    ) -> List[TranscriptionResult]:
+        """
+        Transcribe several independent segments in one batched model call.
+        
+        The segments are laid end to end and passed to faster-whisper's
+        BatchedInferencePipeline as explicit clips, so the encoder and decoder
+        run once for the whole batch instead of once per segment. Each clip
+        is padded to Whisper's 30s window by the model, so no length bucketing
+        is needed here. Falls back to transcribing one by one if batched
+        inference is unavailable or fails, or if the built-in VAD is enabled
+        (it is not applied to explicit clips), so every segment gets the same
+        silence trimming regardless of how many were queued.
+        
+        Args:
+            audios: Segments as float32 numpy arrays (each under 30s)
+            sample_rate: Sample rate in Hz (should be 16000 for Whisper)
+            
+        Returns:
+            One TranscriptionResult per segment, in input order
+        """
+        if len(audios) <= 1 or not BATCHED_AVAILABLE or self.vad_filter:
+            return [self.transcribe(audio, sample_rate) for audio in audios]
+        
+        self._ensure_model_loaded()
+        
+        if sample_rate != 16000:
+            raise ValueError("Audio must be 16kHz for Whisper")
+        
+        start_time = time.time()
+        
+        # Lay segments end to end; clip boundaries are in samples
+        clips = []
+        clip_starts = []  # Seconds, for mapping segments back to clips
+        position = 0
+        for audio in audios:
+            clips.append({"start": position, "end": position + len(audio)})
+            clip_starts.append(position / sample_rate)
+            position += len(audio)
+        combined = np.concatenate(audios).astype(np.float32, copy=False)
+        
+        try:
+            if self._batched_model is None:
+                self._batched_model = BatchedInferencePipeline(model=self._model)
+            
+            segments, info = self._batched_model.transcribe(
+                combined,
+                language=self.language,
+                beam_size=5,
+                batch_size=len(audios),
+                vad_filter=False,  # Only reached when the built-in VAD is off
+                clip_timestamps=clips,
+            )
+            
+            text_parts: List[List[str]] = [[] for _ in audios]
+            for segment in segments:
+                index = max(0, bisect_right(clip_starts, segment.start + 1e-3) - 1)
+                text_parts[index].append(segment.text.strip())
+        except Exception as e:
+            warning(f"WhisperTranscriber: Batched transcription failed, falling back: {e}")
+            return [self.transcribe(audio, sample_rate) for audio in audios]
+        
+        duration = time.time() - start_time
+        debug(f"WhisperTranscriber: Batched {len(audios)} segments in {duration:.2f}s")
+        
+        return [
+            TranscriptionResult(
+                text=self.filter_hallucinations(" ".join(parts)),
+                language=info.language,
+                confidence=info.language_probability,
+                duration=duration,
+            )
+            for parts in text_parts
+        ]
+    
+    def filter_hallucinations(self, text: str) -> str:
         """Filter out known Whisper hallucinations."""
         if not text:
             return text
@@ -1,5 +1,31 @@
 """Translation module exports."""
 
-from .translator import MADLADTranslator, CTRANSLATE2_AVAILABLE
+import importlib
+import importlib.util
+
+# Availability probe without importing the backend (same packages the
+# translator module needs for CTranslate2 models)
+CTRANSLATE2_AVAILABLE = all(
+    importlib.util.find_spec(package) is not None
+    for package in ("ctranslate2", "transformers", "huggingface_hub")
+)
+
+# Imported on first access (PEP 562) so importing the package stays cheap
+_LAZY_IMPORTS = {
+    "MADLADTranslator": ".translator",
+}
 
 __all__ = ["MADLADTranslator", "CTRANSLATE2_AVAILABLE"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
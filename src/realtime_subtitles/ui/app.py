@@ -8,6 +8,7 @@ from PyQt6.QtCore import QTimer, QObject, pyqtSignal
 import threading
 import sys
 import os
+from collections import deque
 from typing import Optional, Union
 
 from .settings_window import SettingsWindow
@@ -16,7 +17,7 @@ from .system_tray import SystemTray
 from ..pipeline import RealtimePipeline, SubtitleEvent
 from ..vosk_pipeline import StreamingPipeline
 from ..livecaptions.pipeline import LiveCaptionsPipeline
-from ..model_manager import ModelManager, ModelType, ModelStatus
+from ..model_manager import ModelType, ModelStatus, get_model_manager
 from ..i18n import t
 
 
@@ -50,6 +51,8 @@ class App:
         self._subtitle_lines: list = []
         self._translation_lines: list = []
         self._max_lines = 3
+        # Segments already shown; a repeat segment_id carries only its translation
+        self._shown_segment_ids: deque = deque(maxlen=32)
         
         # Pipeline signals for thread-safe updates
         self._signals = PipelineSignals()
@@ -212,8 +215,11 @@ class App:
                         on_subtitle=lambda e: self._signals.subtitle.emit(e),
                     )
                 
-                self._pipeline.start()
-                self._signals.started.emit()
+                pipeline = self._pipeline
+                pipeline.start()
+                # _stop() drops the pipeline if the user stopped during model loading
+                if self._pipeline is pipeline:
+                    self._signals.started.emit()
                 
             except Exception as e:
                 self._signals.error.emit(str(e))
@@ -227,6 +233,8 @@ class App:
     
     def _on_pipeline_started(self) -> None:
         """Called when pipeline has started."""
+        if self._pipeline is None:
+            return  # Stopped before the queued signal arrived
         self._is_running = True
         self._settings_window.show_running()
         
@@ -260,10 +268,7 @@ class App:
             # Windows LiveCaptions shows the original text
             # We only need to handle translation
             if self._translation_overlay:
-                # 隱藏原文框（LiveCaptions 已顯示）
-                if hasattr(self._translation_overlay, 'subtitle_label'):
-                    self._translation_overlay.subtitle_label.hide()
-                
+                # 原文傳空字串（LiveCaptions 已顯示），只渲染翻譯
                 # 使用新的雙緩衝字段
                 if (getattr(event, 'committed_translation', None) is not None or 
                     getattr(event, 'draft_translation', None) is not None):
@@ -283,18 +288,30 @@ class App:
         language = event.language
         translated = event.translated_text
         
+        # Translation follow-up for a segment whose text is already on screen
+        is_update = bool(event.segment_id) and event.segment_id in self._shown_segment_ids
+        if event.segment_id and not is_update:
+            self._shown_segment_ids.append(event.segment_id)
+        
         # For precise mode only, maintain history of lines
         # Streaming modes show text directly
-        if not self._is_streaming_mode and text:
-            self._subtitle_lines.append(text)
-            if len(self._subtitle_lines) > self._max_lines:
-                self._subtitle_lines = self._subtitle_lines[-self._max_lines:]
-            display_text = "\n".join(self._subtitle_lines)
+        if is_update:
+            display_text = None
+        elif not self._is_streaming_mode and text:
+            if event.is_partial:
+                # Unconfirmed tail (LocalAgreement): show after the history, don't store it
+                history = self._subtitle_lines[-(self._max_lines - 1):] if self._max_lines > 1 else []
+                display_text = "\n".join(history + [text])
+            else:
+                self._subtitle_lines.append(text)
+                if len(self._subtitle_lines) > self._max_lines:
+                    self._subtitle_lines = self._subtitle_lines[-self._max_lines:]
+                display_text = "\n".join(self._subtitle_lines)
         else:
             display_text = text
         
         # Update overlay
-        if self._overlay:
+        if self._overlay and display_text is not None:
             self._overlay.update_subtitle(display_text, language)
         
         # Update translation overlay
@@ -350,6 +367,7 @@ class App:
         
         self._subtitle_lines = []
         self._translation_lines = []
+        self._shown_segment_ids.clear()
         
         self._settings_window.show_stopped()
         
@@ -359,7 +377,7 @@ class App:
     def _check_all_required_models(self, settings: dict) -> bool:
         """Check if all required models are available and prompt to download if not."""
         missing_models = []
-        manager = ModelManager()
+        manager = get_model_manager()
         mode = settings.get("mode", "precise")
         
         # Skip model checks for LiveCaptions mode (uses Windows built-in)
@@ -0,0 +1,18 @@
+"""
+Shared QFont instances for the PyQt6 windows.
+"""
+
+from PyQt6.QtGui import QFont
+from typing import Dict
+
+
+# Created on first use: Qt needs a QApplication before the first QFont
+_BOLD_FONTS: Dict[int, QFont] = {}
+
+
+def bold_font(size: int) -> QFont:
+    """Get the shared bold font of the given point size."""
+    font = _BOLD_FONTS.get(size)
+    if font is None:
+        font = _BOLD_FONTS[size] = QFont("", size, QFont.Weight.Bold)
+    return font
@@ -6,48 +6,141 @@ from PyQt6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QProgressBar, QScrollArea, QFrame, QMessageBox, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
-from PyQt6.QtGui import QFont
-from typing import Optional, Dict, Callable
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer, QPoint, QRect
+from typing import Optional, Dict, Callable, Tuple
 import threading
+import time
+from collections import defaultdict
+import weakref
 import os
+import re
+import shutil
 import subprocess
 
-from ..model_manager import ModelManager, ModelInfo, ModelType, ModelStatus
+from ..model_manager import ModelManager, ModelInfo, ModelType, ModelStatus, get_model_manager
 from ..i18n import t
+from .fonts import bold_font
+
+
+# Icon prefixes, escaped so editors/encodings can't mangle them
+STAR_PREFIX = "\u2B50 "         # ⭐ recommended model
+PACKAGE_PREFIX = "\U0001F4E6 "  # 📦 window title
+FOLDER_PREFIX = "\U0001F4C1 "   # 📁 open folder button
+DOWNLOAD_PREFIX = "\U0001F4E5 " # 📥 download dialog title
+
+
+def _weak_callback(method: Callable) -> Callable:
+    """
+    Wrap a bound method so the shared ModelManager does not keep its
+    widget alive; calls after the widget is gone are dropped.
+    """
+    ref = weakref.WeakMethod(method)
+    
+    def callback(*args):
+        target = ref()
+        if target is not None:
+            target(*args)
+    
+    return callback
+
+
+# UI strings every model row needs
+ROW_TEXT_KEYS = ("download", "downloaded", "downloading", "download_progress_note")
+
+
+def _row_texts() -> Dict[str, str]:
+    """Translate the model row strings for the current language."""
+    return {key: t(key) for key in ROW_TEXT_KEYS}
+
+
+class _ProgressThrottle:
+    """
+    Decides which download progress ticks are worth showing.
+    
+    Downloads can report thousands of ticks; a tick passes when the
+    percentage or text changed and at least INTERVAL seconds have gone by.
+    Texts that only differ in their numbers (the MB counter of URL
+    downloads) are the same phase and stay under the interval; completion,
+    errors and a new phase (verifying, extracting, ...) always pass.
+    """
+    
+    INTERVAL = 0.1  # At most ~10 updates per second per model
+    _DIGITS = re.compile(r"\d+")
+    
+    def __init__(self):
+        self._last: Dict[str, Tuple[float, int, str]] = {}  # model id -> (time, percent, text)
+    
+    def should_emit(self, model_id: str, progress: float, status_text: str) -> bool:
+        """Check a tick (download thread) and remember it if it passes."""
+        percent = int(progress * 100)
+        now = time.monotonic()
+        last = self._last.get(model_id)
+        if last is not None and 0.0 <= progress < 1.0:
+            last_time, last_percent, last_text = last
+            same_phase = self._DIGITS.sub("", status_text) == self._DIGITS.sub("", last_text)
+            if same_phase and (
+                (percent == last_percent and status_text == last_text)
+                or now - last_time < self.INTERVAL
+            ):
+                return False
+        self._last[model_id] = (now, percent, status_text)
+        return True
 
 
 class ModelRow(QFrame):
     """A single row displaying a model's status and actions."""
     
-    progress_updated = pyqtSignal(float, str)
+    progress_pending = pyqtSignal()  # A progress update is waiting in _pending_progress
+    progress_deferred = pyqtSignal()  # A throttled update is waiting; flush after the interval
+    download_finished = pyqtSignal(bool)  # Download thread is done (success)
+    model_completed = pyqtSignal(str, object)  # Model id and final ModelStatus, once downloaded
+    
+    STATUS_POLL_MS = 1000  # Re-check interval while a cancelled download winds down
     
     def __init__(
         self,
         model: ModelInfo,
         manager: ModelManager,
-        on_status_change: Optional[Callable] = None,
+        texts: Optional[Dict[str, str]] = None,
     ):
         super().__init__()
         
         self.model = model
         self.manager = manager
-        self.on_status_change = on_status_change
         
+        # Progress ticks from the download thread are coalesced: only the
+        # latest (progress, status_text) is kept, and at most one flush is
+        # queued on the UI thread at a time
+        self._progress_lock = threading.Lock()
+        self._pending_progress: Optional[Tuple[float, str]] = None
+        self._progress_scheduled = False
+        self._progress_throttle = _ProgressThrottle()
+        self._download_done = False  # Final status applied; late flushes are ignored
+        # Last values applied to the widgets, so unchanged ones are not reset
+        self._last_percent = -1
+        self._last_status_text: Optional[str] = None
+        # Status that arrived while the row was scrolled out of view
+        self._deferred_status: Optional[ModelStatus] = None
+        self._applied_status: Optional[ModelStatus] = None  # Status the widgets show
+        
+        # Translated strings; the window translates them once and shares them
+        # between rows (a new window is built each time it opens)
+        self._texts = texts or _row_texts()
+        
+        # Styled by ModelManagerWindow's stylesheet (parsed once for all rows)
         self.setObjectName("model_row")
-        self.setStyleSheet("""
-            #model_row {
-                background-color: #333333;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
         
         self._create_ui()
-        self._update_status()
+        self._update_status(force=True)
         
-        # Connect signal
-        self.progress_updated.connect(self._update_progress_ui)
+        # Connect signals
+        self.progress_pending.connect(self._flush_progress)
+        self.progress_deferred.connect(self._schedule_deferred_flush)
+        self.download_finished.connect(self._on_download_finished)
+        
+        # A download started elsewhere (earlier window, download dialog): follow it
+        if self.manager.get_status(self.model) == ModelStatus.DOWNLOADING:
+            self._follow_download()
     
     def _create_ui(self):
         """Create the row UI."""
@@ -61,18 +154,18 @@ class ModelRow(QFrame):
         # Model name with emoji if recommended
         name = t(self.model.name) if self.model.name.startswith("model_name_") else self.model.name
         if "large-v3" in self.model.id and "turbo" not in self.model.id:
-            name = "⭐ " + name  # Recommended
+            name = STAR_PREFIX + name  # Recommended
         
         self.name_label = QLabel(name)
-        self.name_label.setFont(QFont("", 12, QFont.Weight.Bold))
-        self.name_label.setStyleSheet("color: white;")
+        self.name_label.setFont(bold_font(12))
+        self.name_label.setObjectName("model_name")
         top_row.addWidget(self.name_label)
         
         top_row.addStretch()
         
         # Size
         size_label = QLabel(f"({self.model.get_size_display()})")
-        size_label.setStyleSheet("color: #888888;")
+        size_label.setObjectName("model_size")
         top_row.addWidget(size_label)
         
         layout.addLayout(top_row)
@@ -81,37 +174,25 @@ class ModelRow(QFrame):
         desc = t(self.model.description) if self.model.description.startswith("model_desc_") else self.model.description
         if desc:
             desc_label = QLabel(desc)
-            desc_label.setStyleSheet("color: #aaaaaa; font-size: 12px;")
+            desc_label.setObjectName("model_desc")
             desc_label.setWordWrap(True)
             layout.addWidget(desc_label)
         
         # Progress bar (hidden by default)
         self.progress_bar = QProgressBar()
         self.progress_bar.setMaximum(100)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background-color: #444444;
-                border-radius: 4px;
-                height: 8px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #3B8ED0;
-                border-radius: 4px;
-            }
-        """)
         self.progress_bar.hide()
         layout.addWidget(self.progress_bar)
         
         # Status text
         self.status_text = QLabel("")
-        self.status_text.setStyleSheet("color: #888888; font-size: 11px;")
+        self.status_text.setObjectName("model_status")
         self.status_text.hide()
         layout.addWidget(self.status_text)
 
         # Progress disclaimer
-        self.progress_note = QLabel(t("download_progress_note"))
-        self.progress_note.setStyleSheet("color: #666666; font-size: 10px;")
+        self.progress_note = QLabel(self._texts["download_progress_note"])
+        self.progress_note.setObjectName("model_progress_note")
         self.progress_note.hide()
         layout.addWidget(self.progress_note)
         
@@ -119,44 +200,68 @@ class ModelRow(QFrame):
         button_row = QHBoxLayout()
         button_row.addStretch()
         
-        self.action_button = QPushButton(t("download"))
+        self.action_button = QPushButton(self._texts["download"])
         self.action_button.setMaximumWidth(120)
         self.action_button.clicked.connect(self._on_action)
         button_row.addWidget(self.action_button)
         
         layout.addLayout(button_row)
     
-    def _update_status(self):
-        """Update UI based on model status."""
-        status = self.manager.get_status(self.model)
+    def _update_status(self, force: bool = False):
+        """Update UI based on the model status reported by the manager."""
+        self._apply_status(self.manager.get_status(self.model), force)
+    
+    def _apply_status(self, status: ModelStatus, force: bool = False):
+        """
+        Update UI for a known model status.
+        
+        Deferred while the row is scrolled out of view (or the window is
+        hidden); apply_if_dirty() catches up once it is visible again.
+        """
+        if not force and self.visibleRegion().isEmpty():
+            self._deferred_status = status
+            return
+        self._deferred_status = None
+        if status == self._applied_status:
+            return  # Widgets already show it; skip the restyle
+        self._applied_status = status
         
         if status == ModelStatus.DOWNLOADED:
-            self.action_button.setText(t("downloaded"))
+            self.action_button.setText(self._texts["downloaded"])
             self.action_button.setEnabled(False)
-            self.action_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2a5a2a;
-                    color: #90EE90;
-                    border-radius: 6px;
-                }
-            """)
+            self._set_button_state("downloaded")
             self.progress_bar.hide()
             self.status_text.hide()
             self.progress_note.hide()
         elif status == ModelStatus.DOWNLOADING:
-            self.action_button.setText(t("downloading"))
+            self.action_button.setText(self._texts["downloading"])
             self.action_button.setEnabled(False)
             self.progress_bar.show()
             self.status_text.show()
             self.progress_note.show()
         else:
-            self.action_button.setText(t("download"))
+            self.action_button.setText(self._texts["download"])
             self.action_button.setEnabled(True)
-            self.action_button.setStyleSheet("")
+            self._set_button_state("")
             self.progress_bar.hide()
             self.status_text.hide()
             self.progress_note.hide()
     
+    def _set_button_state(self, state: str):
+        """Switch the action button's [state] style selector."""
+        if self.action_button.property("state") == state:
+            return
+        self.action_button.setProperty("state", state)
+        # Property selectors are only re-evaluated on repolish
+        style = self.action_button.style()
+        style.unpolish(self.action_button)
+        style.polish(self.action_button)
+    
+    def apply_if_dirty(self):
+        """Apply a deferred status update if the row is visible now."""
+        if self._deferred_status is not None and not self.visibleRegion().isEmpty():
+            self._apply_status(self._deferred_status)
+    
     def _on_action(self):
         """Handle action button click."""
         status = self.manager.get_status(self.model)
@@ -170,28 +275,110 @@ class ModelRow(QFrame):
         self.progress_bar.setValue(0)
         self.status_text.show()
         self.progress_note.show()
-        
-        def progress_callback(model_id: str, progress: float, status_text: str):
-            self.progress_updated.emit(progress, status_text)
+        # Keep the change caches in line with what was just set directly
+        self._applied_status = ModelStatus.DOWNLOADING
+        self._last_percent = 0
+        self._download_done = False
         
         # Start download in background
-        self.manager.download(self.model, progress_callback)
+        self.manager.download(
+            self.model,
+            _weak_callback(self._on_download_progress),
+            on_complete=_weak_callback(self._on_download_complete),
+        )
+    
+    def _follow_download(self):
+        """Receive progress and the final status of a download this row did not start."""
+        self._download_done = False
+        attached = self.manager.add_listeners(
+            self.model,
+            _weak_callback(self._on_download_progress),
+            on_complete=_weak_callback(self._on_download_complete),
+        )
+        if not attached:
+            # A cancelled run is still finishing its current file and takes
+            # no listeners: check again until it is gone (or restarted)
+            QTimer.singleShot(self.STATUS_POLL_MS, self._poll_download)
+    
+    def _poll_download(self):
+        """Re-check a download the row could not attach to."""
+        if self.manager.get_status(self.model) == ModelStatus.DOWNLOADING:
+            self._follow_download()
+        else:
+            self._update_status()
+    
+    def _on_download_progress(self, model_id: str, progress: float, status_text: str):
+        """Record a progress tick (download thread) and queue one flush."""
+        emit = self._progress_throttle.should_emit(model_id, progress, status_text)
+        with self._progress_lock:
+            # Throttled ticks still update the pending value for the next flush
+            self._pending_progress = (progress, status_text)
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+        if emit:
+            self.progress_pending.emit()
+        else:
+            # Throttled: still render it once the interval is up, in case
+            # no further tick arrives to carry it (slow, sparse downloads)
+            self.progress_deferred.emit()
+    
+    def _schedule_deferred_flush(self):
+        """Flush the pending progress after the throttle interval (UI thread)."""
+        QTimer.singleShot(int(_ProgressThrottle.INTERVAL * 1000), self._flush_progress)
+    
+    def _flush_progress(self):
+        """Apply the latest pending progress update (UI thread)."""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_scheduled = False
+        # A deferred flush can fire after the final status was applied
+        if pending is not None and not self._download_done:
+            self._update_progress_ui(*pending)
     
     def _update_progress_ui(self, progress: float, status_text: str):
         """Update progress display (called from signal)."""
-        self.progress_bar.setValue(int(progress * 100))
-        self.status_text.setText(status_text)
-        self.progress_note.show()
-        
-        if progress >= 1.0:
-            self._update_status()
-            if self.on_status_change:
-                self.on_status_change()
+        percent = int(progress * 100)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress_bar.setValue(percent)
+        if status_text != self._last_status_text:
+            self._last_status_text = status_text
+            self.status_text.setText(status_text)
+        if self.progress_note.isHidden():
+            self.progress_note.show()
+    
+    def _on_download_complete(self, model_id: str, success: bool):
+        """Forward the end of the download to the UI thread (download thread)."""
+        self.download_finished.emit(success)
+    
+    def _on_download_finished(self, success: bool):
+        """Show the final status pushed by the manager (UI thread)."""
+        # Take progress still queued for this download so it can't overwrite
+        # the final state later; only an error message in it is still shown
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_scheduled = False
+        if pending is not None and not success:
+            self._update_progress_ui(*pending)
+        self._download_done = True
+        status = ModelStatus.DOWNLOADED if success else ModelStatus.NOT_DOWNLOADED
+        self._apply_status(status)
+        if success:
+            self.model_completed.emit(self.model.id, status)
+        elif self._last_status_text:
+            # Keep the error message readable next to the re-enabled button
+            self.status_text.show()
 
 
 class ModelManagerWindow(QDialog):
     """Window for managing model downloads."""
     
+    ROW_PLACEHOLDER_HEIGHT = 130  # Approximate ModelRow height reserved until it is built
+    ROW_BUILD_MARGIN = 200  # Rows this far outside the viewport are built ahead of time
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -218,10 +405,52 @@ class ModelManagerWindow(QDialog):
                 background-color: #555555;
                 color: #888888;
             }
+            QPushButton[state="downloaded"] {
+                background-color: #2a5a2a;
+                color: #90EE90;
+                border-radius: 6px;
+            }
+            QLabel#section_title {
+                color: #888888;
+                margin-top: 10px;
+            }
+            #model_row {
+                background-color: #333333;
+                border-radius: 8px;
+                padding: 10px;
+            }
+            QLabel#model_size {
+                color: #888888;
+            }
+            QLabel#model_desc {
+                color: #aaaaaa;
+                font-size: 12px;
+            }
+            QLabel#model_status {
+                color: #888888;
+                font-size: 11px;
+            }
+            QLabel#model_progress_note {
+                color: #666666;
+                font-size: 10px;
+            }
+            #model_row QProgressBar {
+                background-color: #444444;
+                border-radius: 4px;
+                height: 8px;
+                text-align: center;
+            }
+            #model_row QProgressBar::chunk {
+                background-color: #3B8ED0;
+                border-radius: 4px;
+            }
         """)
         
-        self.manager = ModelManager()
+        self.manager = get_model_manager()
         self.model_rows: Dict[str, ModelRow] = {}
+        # Rows not built yet: model id -> (placeholder, model, section layout)
+        self._placeholders: Dict[str, Tuple[QWidget, ModelInfo, QVBoxLayout]] = {}
+        self._row_texts = _row_texts()  # Shared by all rows
         
         self._create_ui()
     
@@ -232,8 +461,8 @@ class ModelManagerWindow(QDialog):
         layout.setSpacing(15)
         
         # Title
-        title = QLabel("📦 " + t("model_manager_title"))
-        title.setFont(QFont("", 16, QFont.Weight.Bold))
+        title = QLabel(PACKAGE_PREFIX + t("model_manager_title"))
+        title.setFont(bold_font(16))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -257,27 +486,42 @@ class ModelManagerWindow(QDialog):
             }
         """)
         
+        # Enumerate the catalog once and split it by section
+        all_models = self.manager.get_all_models()
+        models_by_type = defaultdict(list)
+        for model in all_models:
+            models_by_type[model.model_type].append(model)
+        
+        # One folder scan for every row's initial status
+        self.manager.prime_status_cache(all_models)
+        
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
         scroll_layout.setSpacing(10)
         
         # Whisper models section
-        self._create_model_section(scroll_layout, t("whisper_models"), [ModelType.WHISPER])
+        self._create_model_section(scroll_layout, t("whisper_models"), models_by_type[ModelType.WHISPER])
         
         # Translation models section
-        self._create_model_section(scroll_layout, t("translation_models"), [ModelType.NLLB])
+        self._create_model_section(scroll_layout, t("translation_models"), models_by_type[ModelType.NLLB])
         
         # Streaming models section
-        self._create_model_section(scroll_layout, t("streaming_models"), [ModelType.SHERPA, ModelType.VOSK])
+        self._create_model_section(
+            scroll_layout,
+            t("streaming_models"),
+            models_by_type[ModelType.SHERPA] + models_by_type[ModelType.VOSK],
+        )
         
         scroll_layout.addStretch()
         scroll.setWidget(scroll_content)
+        scroll.verticalScrollBar().valueChanged.connect(self._on_scroll)
         layout.addWidget(scroll)
+        self._scroll = scroll
         
         # Footer buttons
         footer = QHBoxLayout()
         
-        open_folder_btn = QPushButton("📁 " + t("open_models_folder"))
+        open_folder_btn = QPushButton(FOLDER_PREFIX + t("open_models_folder"))
         open_folder_btn.clicked.connect(self._open_models_folder)
         footer.addWidget(open_folder_btn)
         
@@ -289,24 +533,89 @@ class ModelManagerWindow(QDialog):
         
         layout.addLayout(footer)
     
-    def _create_model_section(self, parent_layout, title: str, model_types):
+    def _create_model_section(self, parent_layout, title: str, models: list):
         """Create a section for a group of models."""
         # Section title
         section_title = QLabel(title)
-        section_title.setFont(QFont("", 13, QFont.Weight.Bold))
-        section_title.setStyleSheet("color: #888888; margin-top: 10px;")
+        section_title.setFont(bold_font(13))
+        section_title.setObjectName("section_title")
         parent_layout.addWidget(section_title)
         
-        # Model rows
-        for model in self.manager.get_all_models():
-            if model.model_type in model_types:
-                row = ModelRow(model, self.manager, self._on_status_change)
-                self.model_rows[model.id] = row
-                parent_layout.addWidget(row)
+        # Rows go into their own container so sections keep their order
+        # while rows are still being built
+        container = QWidget()
+        container_layout = QVBoxLayout(container)
+        container_layout.setContentsMargins(0, 0, 0, 0)
+        container_layout.setSpacing(parent_layout.spacing())
+        parent_layout.addWidget(container)
+        
+        # Reserve space with empty placeholders; the real rows are built
+        # once they come near the viewport (see _build_visible_rows)
+        for model in models:
+            placeholder = QWidget()
+            placeholder.setFixedHeight(self.ROW_PLACEHOLDER_HEIGHT)
+            container_layout.addWidget(placeholder)
+            self._placeholders[model.id] = (placeholder, model, container_layout)
+    
+    def _build_visible_rows(self):
+        """Replace placeholders in or near the viewport with real rows."""
+        if not self._placeholders:
+            return
+        viewport = self._scroll.viewport()
+        area = viewport.rect().adjusted(0, -self.ROW_BUILD_MARGIN, 0, self.ROW_BUILD_MARGIN)
+        
+        # Swap in all rows of this pass before repainting
+        content = self._scroll.widget()
+        content.setUpdatesEnabled(False)
+        built = False
+        try:
+            for model_id, (placeholder, model, layout) in list(self._placeholders.items()):
+                rect = QRect(placeholder.mapTo(viewport, QPoint(0, 0)), placeholder.size())
+                if not rect.intersects(area):
+                    continue
+                row = ModelRow(model, self.manager, self._row_texts)
+                row.model_completed.connect(self._on_model_completed)
+                layout.replaceWidget(placeholder, row)
+                placeholder.deleteLater()
+                del self._placeholders[model_id]
+                self.model_rows[model_id] = row
+                built = True
+        finally:
+            # Never leave the list unpainted, even if building a row failed
+            content.setUpdatesEnabled(True)
+        
+        # Real rows may be shorter than the placeholders and pull more
+        # placeholders into view: check again once the layout has settled
+        if built:
+            QTimer.singleShot(0, self._build_visible_rows)
+    
+    def _on_scroll(self, *_):
+        """Build rows scrolled into view and refresh deferred ones."""
+        self._build_visible_rows()
+        self._apply_dirty_rows()
+    
+    def _on_model_completed(self, model_id: str, status: ModelStatus):
+        """
+        Cache the status pushed for the model that just finished downloading.
+        
+        The row already shows it, so nothing is re-scanned; other rows are
+        untouched since every model has its own folder.
+        """
+        row = self.model_rows.get(model_id)
+        if row is not None:
+            self.manager.record_status(row.model, status)
+    
+    def _apply_dirty_rows(self, *_):
+        """Bring rows that just scrolled into view up to date."""
+        for row in self.model_rows.values():
+            row.apply_if_dirty()
     
-    def _on_status_change(self):
-        """Called when any model's status changes."""
-        pass
+    def showEvent(self, event):
+        """Build the first screenful of rows and catch up on status changes."""
+        super().showEvent(event)
+        # Geometry is only valid once the layout ran, after this event
+        QTimer.singleShot(0, self._build_visible_rows)
+        self._apply_dirty_rows()
     
     def _open_models_folder(self):
         """Open the models folder in file explorer."""
@@ -324,17 +633,25 @@ class ModelManagerWindow(QDialog):
 class ModelDownloadDialog(QDialog):
     """Dialog for downloading missing models."""
     
-    progress_updated = pyqtSignal(str, float, str)
+    DRAIN_INTERVAL_MS = 100  # Progress is applied to the widgets at 10 Hz
     
     def __init__(self, parent, models_to_download: list, on_complete: Optional[Callable] = None):
         super().__init__(parent)
         
         self.models_to_download = models_to_download
         self.on_complete = on_complete
-        self.manager = ModelManager()
+        self.manager = get_model_manager()
         self._completed_count = 0
+        self._completed_ids: set = set()  # Models already counted as complete
         self._destroyed = False
         
+        # Download threads store their latest (progress, status_text) here
+        # and never touch Qt; a timer drains it on the UI thread
+        self._progress_state: Dict[str, Tuple[float, str]] = {}
+        self._state_lock = threading.Lock()
+        # Last (percent, status_text) applied per model
+        self._last_progress: Dict[str, Tuple[int, str]] = {}
+        
         self.setWindowTitle(t("download_title"))
         # Dynamic height: base 200 + 140 per model
         height = 200 + (len(models_to_download) * 140)
@@ -347,13 +664,40 @@ class ModelDownloadDialog(QDialog):
             QLabel {
                 color: white;
             }
+            QFrame#download_entry {
+                background-color: #2a2a2a;
+                border-radius: 8px;
+            }
+            QLabel#download_name {
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QLabel#download_status {
+                color: #888888;
+                font-size: 11px;
+            }
+            QLabel#download_note {
+                color: #666666;
+                font-size: 10px;
+            }
+            #download_entry QProgressBar {
+                background-color: #444444;
+                border-radius: 4px;
+            }
+            #download_entry QProgressBar::chunk {
+                background-color: #3B8ED0;
+                border-radius: 4px;
+            }
         """)
         
         self._create_ui()
-        self._start_downloads()
         
-        # Connect signal
-        self.progress_updated.connect(self._update_progress)
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setInterval(self.DRAIN_INTERVAL_MS)
+        self._drain_timer.timeout.connect(self._drain_progress)
+        self._drain_timer.start()
+        
+        self._start_downloads()
     
     def _create_ui(self):
         """Create the dialog UI."""
@@ -362,64 +706,48 @@ class ModelDownloadDialog(QDialog):
         layout.setSpacing(20)
         
         # Title
-        title = QLabel("📥 " + t("downloading_models"))
-        title.setFont(QFont("", 16, QFont.Weight.Bold))
+        title = QLabel(DOWNLOAD_PREFIX + t("downloading_models"))
+        title.setFont(bold_font(16))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         # Model progress sections
-        self.progress_widgets = {}
+        self.progress_widgets: Dict[str, Tuple[QProgressBar, QLabel]] = {}
+        waiting_text = t("download_waiting")
+        progress_note_text = t("download_progress_note")
         
         for model in self.models_to_download:
             frame = QFrame()
             frame.setMinimumHeight(110)
-            frame.setStyleSheet("""
-                QFrame {
-                    background-color: #2a2a2a;
-                    border-radius: 8px;
-                }
-            """)
+            frame.setObjectName("download_entry")
             frame_layout = QVBoxLayout(frame)
             frame_layout.setContentsMargins(15, 15, 15, 15)
             frame_layout.setSpacing(8)
             
             name = t(model.name) if model.name.startswith("model_name_") else model.name
             name_label = QLabel(f"{name} ({model.get_size_display()})")
-            name_label.setStyleSheet("color: white; font-size: 14px; font-weight: bold;")
+            name_label.setObjectName("download_name")
             name_label.setMinimumHeight(22)
             frame_layout.addWidget(name_label)
             
             progress_bar = QProgressBar()
             progress_bar.setMaximum(100)
             progress_bar.setMinimumHeight(20)
-            progress_bar.setStyleSheet("""
-                QProgressBar {
-                    background-color: #444444;
-                    border-radius: 4px;
-                }
-                QProgressBar::chunk {
-                    background-color: #3B8ED0;
-                    border-radius: 4px;
-                }
-            """)
             frame_layout.addWidget(progress_bar)
             
-            status_label = QLabel(t("download_waiting"))
-            status_label.setStyleSheet("color: #888888; font-size: 11px;")
+            status_label = QLabel(waiting_text)
+            status_label.setObjectName("download_status")
             status_label.setMinimumHeight(18)
             frame_layout.addWidget(status_label)
 
-            progress_note = QLabel(t("download_progress_note"))
-            progress_note.setStyleSheet("color: #666666; font-size: 10px;")
+            progress_note = QLabel(progress_note_text)
+            progress_note.setObjectName("download_note")
             progress_note.setMinimumHeight(16)
             frame_layout.addWidget(progress_note)
             
             layout.addWidget(frame)
             
-            self.progress_widgets[model.id] = {
-                "progress_bar": progress_bar,
-                "status_label": status_label,
-            }
+            self.progress_widgets[model.id] = (progress_bar, status_label)
         
         layout.addStretch()
         
@@ -444,27 +772,49 @@ class ModelDownloadDialog(QDialog):
     def _start_downloads(self):
         """Start downloading all models."""
         for model in self.models_to_download:
-            def make_callback(m):
-                return lambda mid, prog, status: self.progress_updated.emit(m.id, prog, status)
-            
-            self.manager.download(model, make_callback(model))
+            self.manager.download(model, _weak_callback(self._on_download_progress))
+    
+    def _on_download_progress(self, model_id: str, progress: float, status_text: str):
+        """Record a progress tick (download thread)."""
+        # Every tick overwrites the latest value; the 10 Hz drain timer is the throttle
+        with self._state_lock:
+            self._progress_state[model_id] = (progress, status_text)
+    
+    def _drain_progress(self):
+        """Apply the latest progress of every model (UI thread, timer)."""
+        with self._state_lock:
+            if not self._progress_state:
+                return
+            latest = self._progress_state
+            self._progress_state = {}
+        for model_id, (progress, status_text) in latest.items():
+            self._update_progress(model_id, progress, status_text)
+        self._check_all_complete()
     
     def _update_progress(self, model_id: str, progress: float, status_text: str):
         """Update progress for a model."""
-        if self._destroyed or model_id not in self.progress_widgets:
+        widgets = self.progress_widgets.get(model_id)
+        if self._destroyed or widgets is None:
             return
         
-        widgets = self.progress_widgets[model_id]
-        widgets["progress_bar"].setValue(int(progress * 100))
-        widgets["status_label"].setText(status_text)
-        
-        if progress >= 1.0:
+        progress_bar, status_label = widgets
+        percent = int(progress * 100)
+        last_percent, last_text = self._last_progress.get(model_id, (-1, None))
+        if percent != last_percent:
+            progress_bar.setValue(percent)
+        if status_text != last_text:
+            status_label.setText(status_text)
+        self._last_progress[model_id] = (percent, status_text)
+        
+        # Archive downloads report 1.0 twice; count each model once
+        if progress >= 1.0 and model_id not in self._completed_ids:
+            self._completed_ids.add(model_id)
             self._completed_count += 1
-            self._check_all_complete()
     
     def _check_all_complete(self):
         """Check if all downloads are complete."""
         if self._completed_count >= len(self.models_to_download):
+            self._drain_timer.stop()
             self.cancel_button.setText(t("close"))
             self.cancel_button.setStyleSheet("""
                 QPushButton {
@@ -492,39 +842,64 @@ class ModelDownloadDialog(QDialog):
             if result != QMessageBox.StandardButton.Yes:
                 return
             
-            # User confirmed cancel - delete partial downloaded models and force quit
-            import shutil
-            
-            for model in self.models_to_download:
-                model_path = self.manager.get_model_path(model)
-                if model_path and model_path.exists():
-                    try:
-                        if model_path.is_dir():
-                            shutil.rmtree(model_path)
-                        else:
-                            os.remove(model_path)
-                    except Exception:
-                        pass
-                
-                # Also try to clear HuggingFace cache
-                if model.hf_repo:
-                    try:
-                        hf_cache = os.path.expanduser("~/.cache/huggingface/hub")
-                        repo_name = model.hf_repo.replace("/", "--")
-                        for entry in os.listdir(hf_cache):
-                            if repo_name in entry:
-                                cache_path = os.path.join(hf_cache, entry)
-                                if os.path.isdir(cache_path):
-                                    shutil.rmtree(cache_path)
-                    except Exception:
-                        pass
-            
-            # Force exit
-            os._exit(0)
+            # User confirmed cancel - stop the downloads and delete partial
+            # files in the background so the UI does not freeze
+            threads = [self.manager.cancel(model) for model in self.models_to_download]
+            threading.Thread(
+                target=self._cleanup_partial_downloads,
+                args=(threads,),
+                daemon=True,
+            ).start()
 
         self._destroyed = True
+        self._drain_timer.stop()
         self.accept()
     
+    def _cleanup_partial_downloads(self, threads: list):
+        """Delete cancelled models' files once their downloads stopped (background thread)."""
+        # Files are still being written until each download thread exits.
+        # A Hugging Face download only stops after its current file, so this
+        # can wait for the rest of a large file (see ModelManager.cancel)
+        for thread in threads:
+            if thread is not None:
+                thread.join()
+        
+        # A model downloaded again meanwhile (e.g. from a new dialog) keeps its files
+        cancelled = [
+            model for model in self.models_to_download
+            if self.manager.get_status(model) != ModelStatus.DOWNLOADING
+        ]
+        
+        for model in cancelled:
+            model_path = self.manager.get_model_path(model)
+            if model_path and model_path.exists():
+                try:
+                    if model_path.is_dir():
+                        shutil.rmtree(model_path)
+                    else:
+                        os.remove(model_path)
+                except Exception:
+                    pass
+        
+        # Also try to clear HuggingFace cache: one scan matched against every
+        # cancelled repo instead of one scan per model
+        repo_names = [m.hf_repo.replace("/", "--") for m in cancelled if m.hf_repo]
+        if not repo_names:
+            return
+        try:
+            hf_cache = os.path.expanduser("~/.cache/huggingface/hub")
+            # scandir's DirEntry carries the file type, so no stat per entry
+            with os.scandir(hf_cache) as entries:
+                matches = [
+                    entry.path for entry in entries
+                    if any(repo_name in entry.name for repo_name in repo_names)
+                    and entry.is_dir(follow_symlinks=False)
+                ]
+        except OSError:
+            return
+        for cache_path in matches:
+            shutil.rmtree(cache_path, ignore_errors=True)
+    
     def closeEvent(self, event):
         """Handle window close."""
         if self._destroyed:
@@ -10,13 +10,15 @@ from PyQt6.QtWidgets import (
     QMessageBox, QApplication
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtGui import QIcon
 from typing import Callable, Optional
 import os
+import subprocess
 import sys
 
 from ..settings_manager import get_settings_manager
 from .model_manager_window import show_model_manager
+from .fonts import bold_font
 from ..i18n import t, get_current_language, set_language, LANGUAGES
 
 
@@ -296,7 +298,7 @@ class SettingsWindow(QMainWindow):
         title_container = QVBoxLayout()
         
         title = QLabel("ARIA")
-        title.setFont(QFont("", 22, QFont.Weight.Bold))
+        title.setFont(bold_font(22))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title_container.addWidget(title)
         
@@ -334,7 +336,7 @@ class SettingsWindow(QMainWindow):
         
         # Title
         title_label = QLabel(title)
-        title_label.setFont(QFont("", 13, QFont.Weight.Bold))
+        title_label.setFont(bold_font(13))
         layout.addWidget(title_label)
         
         return frame, layout
@@ -738,7 +740,6 @@ class SettingsWindow(QMainWindow):
                 settings_path.unlink()
             
             # Restart app
-            import subprocess
             subprocess.Popen([sys.executable, "-m", "realtime_subtitles.ui.app"])
             QApplication.quit()
 
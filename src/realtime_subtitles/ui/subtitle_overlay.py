@@ -7,9 +7,10 @@ A transparent, always-on-top, draggable window that displays subtitles.
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QApplication, QSizeGrip, QFrame, QTextEdit
 )
-from PyQt6.QtCore import Qt, QPoint, QTimer
+from PyQt6.QtCore import Qt, QPoint, QPointF, QTimer
 from PyQt6.QtGui import QFont, QColor, QPalette, QScreen, QPainter
 from typing import Optional, Callable
+import html
 import sys
 
 import ctypes
@@ -32,6 +33,15 @@ class SubtitleOverlay(QWidget):
     # Resize constants
     RESIZE_MARGIN = 10
     
+    # Overlay width as a fraction of screen width, by minimum screen width
+    WIDTH_RATIOS = ((3840, 0.40), (2560, 0.55), (0, 0.70))
+    
+    # Batch window for subtitle updates (caps repaints at 20 Hz)
+    FLUSH_INTERVAL_MS = 50
+    
+    # Delay before writing a moved/resized position to disk
+    SAVE_DELAY_MS = 500
+    
     def __init__(
         self,
         parent: Optional[QWidget] = None,
@@ -43,9 +53,17 @@ class SubtitleOverlay(QWidget):
         
         self._position_key = position_key
         self._on_close_callback = on_close
+        self._settings = get_settings_manager()
+        
+        # Rapid drag/release sequences collapse into one settings write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._settings.save)
         
         # Drag/Resize state
         self._drag_pos: Optional[QPoint] = None
+        self._drag_offset: Optional[QPointF] = None  # Cursor offset while moving
         self._resize_edge: Optional[int] = None
         self._initial_geometry = None
         
@@ -53,6 +71,14 @@ class SubtitleOverlay(QWidget):
         self._window_width = 1200
         self._window_height = 120
         
+        # Subtitle updates are batched and rendered at most every FLUSH_INTERVAL_MS
+        self._pending_update: Optional[tuple] = None
+        self._shown_update: Optional[tuple] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_subtitle)
+        
         # Enable mouse tracking is NOT needed for native event, 
         # but good for other hover effects if any.
         self.setMouseTracking(True)
@@ -63,6 +89,11 @@ class SubtitleOverlay(QWidget):
         
         # Position window after a short delay
         QTimer.singleShot(100, self._position_window)
+        
+        # Re-layout only when the screen itself changes (resolution, scaling)
+        screen = QApplication.primaryScreen()
+        if screen is not None:
+            screen.geometryChanged.connect(self._on_screen_geometry_changed)
     
     def _setup_window(self) -> None:
         """Configure window flags and appearance."""
@@ -92,11 +123,28 @@ class SubtitleOverlay(QWidget):
         # Container frame with dark background
         self.container = QFrame()
         self.container.setObjectName("container")
+        # One stylesheet for the whole overlay; text modes switch via the
+        # "mode" property instead of re-parsing CSS on every toggle
         self.container.setStyleSheet("""
             #container {
                 background-color: rgba(42, 42, 42, 230);
                 border-radius: 12px;
             }
+            QTextEdit {
+                background: transparent;
+                border: none;
+            }
+            QTextEdit#subtitle_text {
+                color: white;
+                font-size: 24px;
+                font-weight: bold;
+            }
+            QTextEdit#subtitle_text[mode="multiline"] {
+                font-size: 22px;
+            }
+            QTextEdit#subtitle_text[mode="translate"] {
+                color: #90EE90;
+            }
         """)
         # Allow mouse events to pass through container to the resizing window
         self.container.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
@@ -107,7 +155,7 @@ class SubtitleOverlay(QWidget):
         container_layout.setContentsMargins(8, 6, 8, 6)
         container_layout.setSpacing(5)
         
-        # Subtitle label (main text)
+        # Subtitle label (original text and translation, rendered as one document)
         self.subtitle_label = QTextEdit()
         self.subtitle_label.setReadOnly(True)
         self.subtitle_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
@@ -116,41 +164,12 @@ class SubtitleOverlay(QWidget):
         self.subtitle_label.setFrameStyle(QFrame.Shape.NoFrame)
         self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.subtitle_label.document().setDocumentMargin(20)
-        self.subtitle_label.setStyleSheet("""
-            QTextEdit {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                background: transparent;
-                border: none;
-            }
-        """)
+        self.subtitle_label.setObjectName("subtitle_text")
+        self.subtitle_label.setProperty("mode", "single")
         # Allow mouse events to pass through text edits
         self.subtitle_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         container_layout.addWidget(self.subtitle_label)
         
-        # Translation label
-        self.translation_label = QTextEdit()
-        self.translation_label.setReadOnly(True)
-        self.translation_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-        self.translation_label.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.translation_label.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.translation_label.setFrameStyle(QFrame.Shape.NoFrame)
-        self.translation_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.translation_label.document().setDocumentMargin(20)
-        self.translation_label.setStyleSheet("""
-            QTextEdit {
-                color: #90EE90;
-                font-size: 20px;
-                background: transparent;
-                border: none;
-            }
-        """)
-        self.translation_label.hide()
-        # Allow mouse events to pass through text edits
-        self.translation_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        container_layout.addWidget(self.translation_label)
-        
         # No size grip needed anymore
     
     def _position_window(self) -> None:
@@ -161,29 +180,34 @@ class SubtitleOverlay(QWidget):
         w, h = screen_geo.width(), screen_geo.height()
         
         # Dynamic width
-        ratio = 0.40 if w >= 3840 else (0.55 if w >= 2560 else 0.70)
+        ratio = next(r for min_w, r in self.WIDTH_RATIOS if w >= min_w)
         self._window_width = int(w * ratio)
         
         # Restore position
-        settings = get_settings_manager()
-        sx = settings.get(f"{self._position_key}_x")
-        sy = settings.get(f"{self._position_key}_y")
+        sx = self._settings.get(f"{self._position_key}_x")
+        sy = self._settings.get(f"{self._position_key}_y")
         
         if sx is not None and sy is not None:
-            self.resize(self._window_width, self._window_height)
-            self.move(int(sx), int(sy))
+            x, y = int(sx), int(sy)
         else:
             x = (w - self._window_width) // 2
             y = int(h * 0.65)
-            self.resize(self._window_width, self._window_height)
-            self.move(x, y)
+        # One geometry change instead of resize() + move()
+        self.setGeometry(x, y, self._window_width, self._window_height)
     
-    def _save_position(self) -> None:
-        """Save current position to settings."""
-        settings = get_settings_manager()
-        settings.set(f"{self._position_key}_x", self.x())
-        settings.set(f"{self._position_key}_y", self.y())
-        settings.save()
+    def _on_screen_geometry_changed(self, _geometry) -> None:
+        """Re-position the window after the primary screen geometry changes."""
+        self._position_window()
+    
+    def _save_position(self, immediate: bool = False) -> None:
+        """Save current position to settings (written to disk after SAVE_DELAY_MS)."""
+        self._settings.set(f"{self._position_key}_x", self.x())
+        self._settings.set(f"{self._position_key}_y", self.y())
+        if immediate:
+            self._save_timer.stop()
+            self._settings.save()
+        else:
+            self._save_timer.start()
 
     # === Paint Event for Transparency ===
     def paintEvent(self, event):
@@ -247,7 +271,8 @@ class SubtitleOverlay(QWidget):
                 self._drag_pos = event.globalPosition().toPoint()
             else:
                 # Start Move (if not on edges)
-                self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+                self._drag_offset = event.globalPosition() - QPointF(self.frameGeometry().topLeft())
+                self.setCursor(Qt.CursorShape.ClosedHandCursor)
             
             event.accept()
     
@@ -271,10 +296,11 @@ class SubtitleOverlay(QWidget):
                 event.accept()
                 return
 
-            # Moving
-            if self._drag_pos and self._resize_edge is None:
-                self.move(event.globalPosition().toPoint() - self._drag_pos)
-                self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            # Moving (skip sub-pixel motion that lands on the current position)
+            if self._drag_offset is not None and self._resize_edge is None:
+                target = (event.globalPosition() - self._drag_offset).toPoint()
+                if target != self.pos():
+                    self.move(target)
                 event.accept()
     
     def _handle_resize(self, global_mouse_pos: QPoint):
@@ -318,6 +344,7 @@ class SubtitleOverlay(QWidget):
             # End ops
             self._resize_edge = None
             self._drag_pos = None
+            self._drag_offset = None
             self._initial_geometry = None
             
             self._save_position()
@@ -326,11 +353,21 @@ class SubtitleOverlay(QWidget):
             self._update_cursor(self._hit_test(event.pos()))
             event.accept()
     
+    def hideEvent(self, event):
+        """Drop queued subtitle updates and flush a pending position save."""
+        # A queued update must not render into (or re-show) a hidden overlay
+        self._flush_timer.stop()
+        self._pending_update = None
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._settings.save()
+        super().hideEvent(event)
+    
     # === Window close ===
     def closeEvent(self, event):
         """Handle window close."""
         # Save position on close
-        self._save_position()
+        self._save_position(immediate=True)
         
         if self._on_close_callback:
             self._on_close_callback()
@@ -354,101 +391,103 @@ class SubtitleOverlay(QWidget):
             committed_translation: Stable translation text (white)
             draft_translation: Unstable/draft translation text (green)
         """
-        self.subtitle_label.setPlainText(text)
-        # Auto-scroll to bottom to show latest content
-        self.subtitle_label.verticalScrollBar().setValue(
-            self.subtitle_label.verticalScrollBar().maximum()
-        )
+        # Show if hidden (only here, never from the deferred flush)
+        if not self.isVisible():
+            self.show()
+        
+        update = (text, translated_text, committed_translation, draft_translation)
+        if update == (self._pending_update or self._shown_update):
+            return
+        self._pending_update = update
+        # Only the latest update within the batch window gets rendered
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_subtitle(self) -> None:
+        """Render the latest pending subtitle update."""
+        if self._pending_update is None:
+            return
+        text, translated_text, committed_translation, draft_translation = self._pending_update
+        self._shown_update, self._pending_update = self._pending_update, None
         
-        # Auto-hide original text label if empty (fixes blank space in Translation Overlay)
+        # Original text uses the widget style; translation is appended inline
+        html_parts = []
         if text and text.strip():
-            self.subtitle_label.show()
-        else:
-            self.subtitle_label.hide()
+            html_parts.append(self._to_html(text))
         
         # Handle translation with dual-color support (committed=white, draft=green)
+        translation_parts = []
         if committed_translation is not None or draft_translation is not None:
-            committed = committed_translation or ""
-            draft = draft_translation or ""
-            
-            # Build HTML with dual colors
-            html_parts = []
-            if committed:
+            if committed_translation:
                 # White text for committed (stable)
-                escaped_committed = committed.replace('\n', '<br>')
-                html_parts.append(f'<span style="color: white;">{escaped_committed}</span>')
-            if draft:
+                translation_parts.append(
+                    f'<span style="color: white;">{self._to_html(committed_translation)}</span>'
+                )
+            if draft_translation:
                 # Green text for draft (in progress)
-                escaped_draft = draft.replace('\n', '<br>')
-                html_parts.append(f'<span style="color: #90EE90;">{escaped_draft}</span>')
-            
-            if html_parts:
-                html_content = '<br>'.join(html_parts)
-                self.translation_label.setHtml(html_content)
-                self.translation_label.verticalScrollBar().setValue(
-                    self.translation_label.verticalScrollBar().maximum()
+                translation_parts.append(
+                    f'<span style="color: #90EE90;">{self._to_html(draft_translation)}</span>'
                 )
-                self.translation_label.show()
-            else:
-                self.translation_label.hide()
         elif translated_text and translated_text.strip():
             # Simple mode: just show translated text in default color
-            self.translation_label.setPlainText(translated_text)
-            self.translation_label.verticalScrollBar().setValue(
-                self.translation_label.verticalScrollBar().maximum()
+            translation_parts.append(
+                f'<span style="color: #90EE90;">{self._to_html(translated_text)}</span>'
+            )
+        if translation_parts:
+            html_parts.append(
+                '<span style="font-size: 20px; font-weight: normal;">'
+                + '<br>'.join(translation_parts)
+                + '</span>'
             )
-            self.translation_label.show()
-        else:
-            self.translation_label.hide()
         
-        # Show if hidden
-        if not self.isVisible():
-            self.show()
+        # Auto-hide when empty (fixes blank space in Translation Overlay)
+        if html_parts:
+            self.subtitle_label.setHtml('<br>'.join(html_parts))
+            # Auto-scroll to bottom to show latest content
+            self.subtitle_label.verticalScrollBar().setValue(
+                self.subtitle_label.verticalScrollBar().maximum()
+            )
+            self.subtitle_label.show()
+        else:
+            self.subtitle_label.clear()
+            self.subtitle_label.hide()
     
     def clear(self) -> None:
         """Clear the subtitle display."""
-        self.subtitle_label.setPlainText("")
-        self.translation_label.setPlainText("")
-        self.translation_label.hide()
+        self._flush_timer.stop()
+        self._pending_update = None
+        self._shown_update = None
+        self.subtitle_label.clear()
+    
+    @staticmethod
+    def _to_html(text: str) -> str:
+        """Escape plain text for the rich-text subtitle label."""
+        return html.escape(text, quote=False).replace('\n', '<br>')
+    
+    def _set_subtitle_mode(self, mode: str) -> None:
+        """Switch the subtitle text style ("single", "multiline" or "translate")."""
+        if self.subtitle_label.property("mode") == mode:
+            return
+        self.subtitle_label.setProperty("mode", mode)
+        # Re-evaluate the property selectors of the overlay stylesheet
+        style = self.subtitle_label.style()
+        style.unpolish(self.subtitle_label)
+        style.polish(self.subtitle_label)
     
     def set_multiline_mode(self, enabled: bool) -> None:
         """Enable multiline mode (taller overlay)."""
         if enabled:
             self._window_height = 180
-            self.subtitle_label.setStyleSheet("""
-                QTextEdit {
-                    color: white;
-                    font-size: 22px;
-                    font-weight: bold;
-                    background: transparent;
-                    border: none;
-                }
-            """)
+            self._set_subtitle_mode("multiline")
         else:
             self._window_height = 120
-            self.subtitle_label.setStyleSheet("""
-                QTextEdit {
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                    background: transparent;
-                    border: none;
-                }
-            """)
+            self._set_subtitle_mode("single")
         self.resize(self._window_width, self._window_height)
     
     def set_translation_mode(self, enabled: bool) -> None:
         """Configure as translation overlay (green text)."""
         if enabled:
-            self.subtitle_label.setStyleSheet("""
-                QTextEdit {
-                    color: #90EE90;
-                    font-size: 24px;
-                    font-weight: bold;
-                    background: transparent;
-                    border: none;
-                }
-            """)
+            self._set_subtitle_mode("translate")
 
 
 # Test